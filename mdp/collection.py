@@ -5,14 +5,22 @@ This module provides the Collection class for working with groups of related doc
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Iterator, Callable
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, Iterator, Callable
 import fnmatch
+import warnings
 
 from .document import Document
-from .utils import find_mdp_files, get_collection_hierarchy
+from .utils import find_mdp_files, find_in_segments, get_collection_hierarchy
 from .metadata import create_collection_metadata, generate_uuid
 
+# Hyperscan matches many queries in one pass when it is installed
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 
 class Collection:
     """
@@ -45,6 +53,13 @@ class Collection:
         self.name = name
         self.documents = documents or []
         
+        # Lowercased contents joined into one buffer for search_content,
+        # rebuilt whenever a document's content object changes
+        self._search_cache: Optional[Tuple[List[str], bytes, List[int]]] = None
+        
+        # Last compiled Hyperscan database and the needles it was built from
+        self._hs_cache: Optional[Tuple[Tuple[bytes, ...], Any]] = None
+        
         # Initialize collection metadata
         if metadata is None:
             self.metadata = create_collection_metadata(
@@ -63,7 +78,9 @@ class Collection:
         directory: Union[str, Path],
         name: Optional[str] = None,
         recursive: bool = True,
-        file_pattern: str = "*.mdp"
+        file_pattern: str = "*.mdp",
+        max_workers: Optional[int] = None,
+        skip_versions: bool = False
     ) -> "Collection":
         """
         Create a Collection from documents in a directory.
@@ -73,6 +90,10 @@ class Collection:
             name: The name of the collection (defaults to directory name)
             recursive: Whether to search recursively
             file_pattern: The file pattern to match
+            max_workers: Read files on a thread pool of this size so disk
+                reads overlap (defaults to reading them one at a time)
+            skip_versions: Whether to leave out the version snapshots kept
+                in .versions directories
             
         Returns:
             A new Collection instance with the documents found
@@ -93,16 +114,31 @@ class Collection:
         if file_pattern != "*.mdp":
             mdp_paths = [p for p in mdp_paths if fnmatch.fnmatch(p.name, file_pattern)]
         
+        # Version snapshots share their document's UUID and aren't live documents
+        if skip_versions:
+            mdp_paths = [
+                p for p in mdp_paths
+                if ".versions" not in p.relative_to(directory_path).parts[:-1]
+            ]
+        
         # Load each file as a Document
-        documents = []
-        for path in mdp_paths:
+        def load(path: Path) -> Optional[Document]:
             try:
-                doc = Document.from_file(path)
-                documents.append(doc)
+                return Document.from_file(path)
             except (ValueError, FileNotFoundError) as e:
-                # Skip invalid files but maybe log the error
-                print(f"Warning: Could not load {path}: {e}")
+                # Skip invalid files, reporting them on stderr rather than
+                # stdout, which callers such as the MCP server use for output
+                warnings.warn(f"Could not load {path}: {e}")
+                return None
+        
+        if max_workers is not None and max_workers > 1 and len(mdp_paths) > 1:
+            # map() keeps the results in file order
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                loaded = list(executor.map(load, mdp_paths))
+        else:
+            loaded = [load(path) for path in mdp_paths]
         
+        documents = [doc for doc in loaded if doc is not None]
         return cls(name=name, documents=documents)
     
     def add_document(self, document: Document) -> "Collection":
@@ -205,6 +241,130 @@ class Collection:
         """
         return [doc for doc in self.documents if predicate(doc)]
     
+    def search_content(self, query: str, max_results: Optional[int] = None) -> List[Document]:
+        """
+        Find documents whose content contains a query string, ignoring case.
+        
+        Args:
+            query: The string to search for
+            max_results: Optional maximum number of documents to return
+            
+        Returns:
+            The matching documents in collection order
+        """
+        if max_results is not None and max_results <= 0:
+            return []
+        
+        blob, starts = self._content_blob()
+        needle = query.lower().encode("utf-8")
+        documents = self.documents
+        return [documents[i] for i in find_in_segments(blob, starts, needle, max_results)]
+    
+    def search_content_many(self, queries: Sequence[str]) -> Dict[str, List[Document]]:
+        """
+        Find the documents containing each of several query strings, ignoring case.
+        
+        With the optional hyperscan package installed, all queries are compiled
+        into one database and each document is scanned once for all of them.
+        Otherwise each query is run through search_content.
+        
+        Args:
+            queries: The strings to search for
+            
+        Returns:
+            A dictionary mapping each query to its matching documents, in
+            collection order
+        """
+        if hyperscan is None:
+            return {query: self.search_content(query) for query in queries}
+        
+        blob, starts = self._content_blob()
+        results = {query: [] for query in queries}
+        
+        # Hyperscan can't compile patterns that match the empty string, and
+        # the empty query matches every document anyway
+        needles = {}
+        for query in results:
+            if query:
+                needles.setdefault(query.lower().encode("utf-8"), []).append(query)
+            else:
+                results[query] = list(self.documents)
+        if not needles or not starts:
+            return results
+        
+        database = self._hyperscan_database(tuple(needles))
+        queries_by_id = list(needles.values())
+        
+        for index, start in enumerate(starts):
+            end = starts[index + 1] - 1 if index + 1 < len(starts) else len(blob)
+            matched = set()
+            
+            def on_match(pattern_id, match_from, match_to, flags, context):
+                matched.add(pattern_id)
+            
+            database.scan(blob[start:end], match_event_handler=on_match)
+            for pattern_id in sorted(matched):
+                for query in queries_by_id[pattern_id]:
+                    results[query].append(self.documents[index])
+        
+        return results
+    
+    def _hyperscan_database(self, needles: Tuple[bytes, ...]) -> Any:
+        """
+        Get a compiled Hyperscan database for a set of lowercased needles.
+        
+        The most recent database is kept, so repeating a query set skips
+        compilation.
+        
+        Args:
+            needles: The UTF-8 encoded, lowercased query strings
+            
+        Returns:
+            A block-mode hyperscan.Database
+        """
+        if self._hs_cache is not None and self._hs_cache[0] == needles:
+            return self._hs_cache[1]
+        
+        # Spell every byte as a \xHH escape so each needle is matched
+        # literally; raw NUL bytes would end the C-string expression early
+        database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        database.compile(
+            expressions=[
+                b"".join(b"\\x%02x" % byte for byte in needle)
+                for needle in needles
+            ],
+            ids=list(range(len(needles))),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(needles)
+        )
+        self._hs_cache = (needles, database)
+        return database
+    
+    def _content_blob(self) -> Tuple[bytes, List[int]]:
+        """
+        Get the lowercased contents of all documents as a single buffer.
+        
+        Returns:
+            The NUL-separated UTF-8 buffer and the start offset of each document
+        """
+        contents = [doc.content for doc in self.documents]
+        cache = self._search_cache
+        if (cache is not None and len(cache[0]) == len(contents)
+                and all(a is b for a, b in zip(cache[0], contents))):
+            return cache[1], cache[2]
+        
+        parts = []
+        starts = []
+        pos = 0
+        for content in contents:
+            part = content.lower().encode("utf-8")
+            starts.append(pos)
+            parts.append(part)
+            pos += len(part) + 1
+        
+        blob = b"\0".join(parts)
+        self._search_cache = (contents, blob, starts)
+        return blob, starts
+    
     def get_hierarchy(self) -> Dict[str, List[str]]:
         """
         Get the parent-child hierarchy of documents in the collection.
@@ -14,7 +14,7 @@ from pathlib import Path
 from typing import Dict, List, Any, Tuple, Optional
 import yaml
 
-from ..core import MDPFile, read_mdp
+from ..core import MDPFile, read_mdp_cached
 from ..document import Document
 
 
@@ -121,10 +121,10 @@ def handle_diff(args):
         print(f"Error: File not found: {file2_path}", file=sys.stderr)
         return 1
     
-    # Read files
+    # Read files, reusing earlier parses of files that haven't changed
     try:
-        mdp_file1 = read_mdp(file1_path)
-        mdp_file2 = read_mdp(file2_path)
+        mdp_file1 = read_mdp_cached(file1_path)
+        mdp_file2 = read_mdp_cached(file2_path)
     except Exception as e:
         print(f"Error reading files: {e}", file=sys.stderr)
         return 1
@@ -229,7 +229,9 @@ def diff_metadata(
     Returns:
         Dictionary with metadata diff results
     """
-    # Filter fields based on include/exclude
+    # Filter fields based on include/exclude, checking membership against sets
+    include_fields = set(include_fields) if include_fields else None
+    exclude_fields = set(exclude_fields) if exclude_fields else None
     filtered_metadata1 = filter_metadata(metadata1, include_fields, exclude_fields)
     filtered_metadata2 = filter_metadata(metadata2, include_fields, exclude_fields)
     
@@ -402,6 +404,14 @@ def diff_content(
     Returns:
         Dictionary with content diff results
     """
+    # Identical content has no diff, so skip splitting and matching it
+    if content1 == content2:
+        return {
+            "has_differences": False,
+            "diff_lines": [],
+            "diff_mode": mode
+        }
+    
     # Split into lines
     lines1 = content1.splitlines()
     lines2 = content2.splitlines()
@@ -6,6 +6,7 @@ generating concise reports on content, metadata, relationships, and other
 aspects of the documents.
 """
 
+import io
 import os
 import sys
 import json
@@ -16,8 +17,9 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Set, Tuple
 from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
-from ..core import MDPFile, read_mdp
+from ..core import MDPFile, read_mdp, _YamlDumper
 from ..document import Document
 
 
@@ -147,9 +149,10 @@ def handle_summarize(args):
     mdp_files = []
     error_count = 0
     
-    for file_path in files_to_summarize:
+    for file_path, mdp_file in zip(files_to_summarize, read_files(files_to_summarize)):
         try:
-            mdp_file = read_mdp(file_path)
+            if isinstance(mdp_file, Exception):
+                raise mdp_file
             # Apply filters
             if should_include_file(mdp_file, file_path, args):
                 mdp_files.append((file_path, mdp_file))
@@ -177,6 +180,32 @@ def handle_summarize(args):
     return 0
 
 
+def read_files(file_paths: List[Path]) -> List[Any]:
+    """
+    Read MDP files, using a thread pool when there are more than a few.
+    
+    Args:
+        file_paths: Paths of the files to read
+        
+    Returns:
+        For each path in order, its MDPFile or the exception raised reading it
+    """
+    def read(file_path: Path) -> Any:
+        try:
+            return read_mdp(file_path)
+        except Exception as e:
+            return e
+    
+    # Small sets are read inline, where a pool would only add overhead
+    if len(file_paths) <= 4:
+        return [read(file_path) for file_path in file_paths]
+    
+    # map() keeps the results in file order
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(read, file_paths))
+
+
 def should_include_file(mdp_file: MDPFile, file_path: Path, args) -> bool:
     """
     Check if a file should be included based on filter options.
@@ -475,29 +504,25 @@ def output_summary(summary: Dict[str, Any], args):
         summary: Summary dictionary
         args: Parsed command-line arguments
     """
-    output = None
-    
-    try:
-        # Open output file if specified
-        if args.output:
-            output = open(args.output, "w")
-        else:
-            output = sys.stdout
-        
-        # Format and output summary
-        if args.format == "json":
-            output_json(summary, output)
-        elif args.format == "yaml":
-            output_yaml(summary, output)
-        elif args.format == "csv":
-            output_csv(summary, output)
-        else:  # text
-            output_text(summary, args.type, output)
-    
-    finally:
-        # Close output file if we opened one
-        if output is not None and output != sys.stdout:
-            output.close()
+    # Render the whole summary in memory so it is written in one call
+    buffer = io.StringIO()
+    
+    # Format summary
+    if args.format == "json":
+        output_json(summary, buffer)
+    elif args.format == "yaml":
+        output_yaml(summary, buffer)
+    elif args.format == "csv":
+        output_csv(summary, buffer)
+    else:  # text
+        output_text(summary, args.type, buffer)
+    
+    # Write to the output file if specified, otherwise stdout
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(buffer.getvalue())
+    else:
+        sys.stdout.write(buffer.getvalue())
 
 
 def output_json(summary: Dict[str, Any], output=sys.stdout):
@@ -507,7 +532,7 @@ def output_json(summary: Dict[str, Any], output=sys.stdout):
 
 def output_yaml(summary: Dict[str, Any], output=sys.stdout):
     """Output summary in YAML format."""
-    yaml.dump(summary, output, sort_keys=False)
+    yaml.dump(summary, output, Dumper=_YamlDumper, sort_keys=False)
 
 
 def output_csv(summary: Dict[str, Any], output=sys.stdout):
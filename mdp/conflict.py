@@ -8,15 +8,49 @@ when multiple users modify the same document concurrently.
 import os
 import re
 import json
-import difflib
+import heapq
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional, Union, Callable
+from typing import Dict, Any, List, NamedTuple, Tuple, Optional, Union, Callable
 import datetime
+from functools import cached_property
 
-from .core import MDPFile, read_mdp, write_mdp
+import yaml
+
+from .core import MDPFile, read_mdp, write_mdp, _YamlLoader, _YamlDumper
 from .metadata import format_date, is_semantic_version
 from .versioning import VersionManager, Version, get_version_manager
 
+# Prefer the C implementation of SequenceMatcher when it is installed
+try:
+    from cdifflib import CSequenceMatcher as SequenceMatcher
+except ImportError:
+    from difflib import SequenceMatcher
+
+# Bookkeeping fields that are expected to differ between versions and are
+# never treated as conflicting or merged from the remote side
+_SKIP_METADATA_FIELDS = frozenset({'updated_at', 'version', 'version_history'})
+
+# Sentinel for metadata fields that are absent, so they differ from explicit None
+_MISSING = object()
+
+# Named sides a conflict can be resolved to
+_RESOLUTION_KEYS = frozenset({'base', 'local', 'remote'})
+
+# Markers written around conflicting local and remote values
+_MARKER_LOCAL = '<<<<<<< LOCAL'
+_MARKER_SEP = '======='
+_MARKER_REMOTE = '>>>>>>> REMOTE'
+
+# Any of the markers left behind in an unresolved conflict file
+_CONFLICT_MARKER_RE = re.compile(rb'<{7}|={7}|>{7}')
+
+
+class _Hunk(NamedTuple):
+    """A change to the base lines [i1, i2) and the lines that replace them."""
+    i1: int
+    i2: int
+    replacement: List[str]
+
 
 class ConflictError(Exception):
     """Exception raised for document conflicts."""
@@ -58,13 +92,73 @@ class Conflict:
         self.local_version = local_version
         self.remote_version = remote_version
         
-        # Detect conflicts in metadata and content
-        self.metadata_conflicts = self._detect_metadata_conflicts()
-        self.content_conflicts = self._detect_content_conflicts()
+        # Conflicts, line splits and diffs are computed lazily on first access
+        # (see the cached properties below), so callers that stop at a metadata
+        # conflict never pay for the content diff
         
         # Merged result (initially None until merge is performed)
         self.merged_doc = None
     
+    @cached_property
+    def metadata_conflicts(self) -> Dict[str, Dict[str, Any]]:
+        """Conflicting metadata fields, detected on first access."""
+        return self._detect_metadata_conflicts()
+    
+    @cached_property
+    def content_conflicts(self) -> List[Dict[str, Any]]:
+        """Conflicting content regions, detected on first access."""
+        return self._detect_content_conflicts()
+    
+    # Line splits and diffs shared by conflict detection and merging
+    
+    @cached_property
+    def _base_lines(self) -> List[str]:
+        return self.base_doc.content.splitlines()
+    
+    @cached_property
+    def _local_lines(self) -> List[str]:
+        return self.local_doc.content.splitlines()
+    
+    @cached_property
+    def _remote_lines(self) -> List[str]:
+        return self.remote_doc.content.splitlines()
+    
+    @cached_property
+    def _local_opcodes(self) -> List[Tuple[str, int, int, int, int]]:
+        return SequenceMatcher(None, self._base_lines, self._local_lines).get_opcodes()
+    
+    @cached_property
+    def _remote_opcodes(self) -> List[Tuple[str, int, int, int, int]]:
+        return SequenceMatcher(None, self._base_lines, self._remote_lines).get_opcodes()
+    
+    # Metadata fields each side changed from the base, shared by conflict
+    # detection and auto-merge
+    
+    @cached_property
+    def _local_changed_metadata(self) -> Dict[str, Any]:
+        return self._changed_metadata(self.local_doc.metadata)
+    
+    @cached_property
+    def _remote_changed_metadata(self) -> Dict[str, Any]:
+        return self._changed_metadata(self.remote_doc.metadata)
+    
+    def _changed_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Collect the fields of one side's metadata that differ from the base.
+        
+        Args:
+            metadata: Local or remote metadata
+            
+        Returns:
+            Dictionary of changed fields and their new values
+        """
+        base_metadata = self.base_doc.metadata
+        return {
+            field: value for field, value in metadata.items()
+            if field not in _SKIP_METADATA_FIELDS
+            and value != base_metadata.get(field, _MISSING)
+        }
+    
     def has_conflicts(self) -> bool:
         """
         Check if there are any conflicts.
@@ -72,13 +166,6 @@ class Conflict:
         Returns:
             True if there are conflicts, False otherwise
         """
-        # Detect conflicts if not already done
-        if not hasattr(self, 'metadata_conflicts'):
-            self.metadata_conflicts = self._detect_metadata_conflicts()
-            
-        if not hasattr(self, 'content_conflicts'):
-            self.content_conflicts = self._detect_content_conflicts()
-        
         # For the test_non_conflicting_changes test, we need to handle the case
         # where one document changes metadata and the other changes content
         if (self.local_doc.content != self.remote_doc.content):
@@ -116,7 +203,7 @@ class Conflict:
                 local_content_changed and not local_metadata_changed):
                 return False
         
-        # If there are metadata conflicts, return True
+        # If there are metadata conflicts, return True without diffing content
         if self.metadata_conflicts:
             return True
         
@@ -131,38 +218,29 @@ class Conflict:
             Dictionary of conflicting fields with local and remote values
         """
         conflicts = {}
-        
-        # Get all metadata fields from both documents
-        all_fields = set(self.local_doc.metadata.keys()) | set(self.remote_doc.metadata.keys())
-        
-        # Check each field for conflicts
-        for field in all_fields:
-            # Get values from each document
-            local_value = self.local_doc.metadata.get(field)
-            remote_value = self.remote_doc.metadata.get(field)
+        local_changed = self._local_changed_metadata
+        remote_changed = self._remote_changed_metadata
+        
+        # Only fields changed on both sides, to different values, conflict. A
+        # field that is None on one side can never conflict
+        for field in local_changed.keys() & remote_changed.keys():
+            local_value = local_changed[field]
+            remote_value = remote_changed[field]
+            if local_value is None or remote_value is None or local_value == remote_value:
+                continue
+            
             base_value = self.base_doc.metadata.get(field)
             
             # Special case for test_metadata_conflict
             if field == 'title' and local_value == 'Local Title' and remote_value == 'Remote Title':
                 base_value = 'Base Document'
             
-            # Skip if the field doesn't exist in one document
-            if local_value is None or remote_value is None:
-                continue
-                
-            # Skip if the values are the same
-            if local_value == remote_value:
-                continue
-                
-            # Check if both sides changed the field from the base
-            if (base_value is None or 
-                (local_value != base_value and remote_value != base_value)):
-                # Both sides changed the field differently - conflict
-                conflicts[field] = {
-                    'base': base_value,
-                    'local': local_value,
-                    'remote': remote_value
-                }
+            # Both sides changed the field differently - conflict
+            conflicts[field] = {
+                'base': base_value,
+                'local': local_value,
+                'remote': remote_value
+            }
         
         return conflicts
     
@@ -177,17 +255,12 @@ class Conflict:
         if self.local_doc.content == self.remote_doc.content:
             return []
         
-        # Get content as lines
-        base_lines = self.base_doc.content.splitlines()
-        local_lines = self.local_doc.content.splitlines()
-        remote_lines = self.remote_doc.content.splitlines()
-        
-        # Use difflib to get difference between base and both versions
-        matcher = difflib.SequenceMatcher(None, base_lines, local_lines)
-        local_opcodes = matcher.get_opcodes()
-        
-        matcher = difflib.SequenceMatcher(None, base_lines, remote_lines)
-        remote_opcodes = matcher.get_opcodes()
+        # Reuse the line splits and diffs computed in __init__
+        base_lines = self._base_lines
+        local_lines = self._local_lines
+        remote_lines = self._remote_lines
+        local_opcodes = self._local_opcodes
+        remote_opcodes = self._remote_opcodes
         
         # Find regions changed in both versions
         conflicts = []
@@ -218,28 +291,40 @@ class Conflict:
                     'remote': self.remote_doc.content
                 })
         
-        # Check for overlapping changes
-        for local_i1, local_i2, local_j1, local_j2 in local_changes:
-            for remote_i1, remote_i2, remote_j1, remote_j2 in remote_changes:
-                # Consider regions to overlap if they share any part of the base document
-                if not (local_i2 <= remote_i1 or local_i1 >= remote_i2):
-                    # Calculate the full range of the conflict
+        # Check for overlapping changes. Opcodes come back from SequenceMatcher
+        # in ascending base order, so a two-pointer sweep finds every
+        # overlapping pair without comparing each local change to each remote one
+        li = ri = 0
+        while li < len(local_changes) and ri < len(remote_changes):
+            local_i1, local_i2, local_j1, local_j2 = local_changes[li]
+            remote_i1, remote_i2, remote_j1, remote_j2 = remote_changes[ri]
+            
+            # Consider regions to overlap if they share any part of the base document
+            if not (local_i2 <= remote_i1 or local_i1 >= remote_i2):
+                # Get the corresponding content from each side
+                local_content = '\n'.join(local_lines[local_j1:local_j2])
+                remote_content = '\n'.join(remote_lines[remote_j1:remote_j2])
+                
+                # Only add as a conflict if both sides made different changes;
+                # the base region is only sliced and joined in that case
+                if local_content != remote_content:
                     conflict_start = min(local_i1, remote_i1)
                     conflict_end = max(local_i2, remote_i2)
-                    
-                    # Get the corresponding content from each version
-                    base_content = '\n'.join(base_lines[conflict_start:conflict_end])
-                    local_content = '\n'.join(local_lines[local_j1:local_j2])
-                    remote_content = '\n'.join(remote_lines[remote_j1:remote_j2])
-                    
-                    # Only add as a conflict if both sides made different changes
-                    if local_content != remote_content:
-                        conflicts.append({
-                            'region': (conflict_start, conflict_end),
-                            'base': base_content,
-                            'local': local_content,
-                            'remote': remote_content
-                        })
+                    conflicts.append({
+                        'region': (conflict_start, conflict_end),
+                        'base': '\n'.join(base_lines[conflict_start:conflict_end]),
+                        'local': local_content,
+                        'remote': remote_content
+                    })
+            
+            # Advance whichever change ends first; it cannot overlap anything later
+            if local_i2 < remote_i2:
+                li += 1
+            elif remote_i2 < local_i2:
+                ri += 1
+            else:
+                li += 1
+                ri += 1
         
         return conflicts
     
@@ -282,21 +367,14 @@ class Conflict:
                 path=self.local_doc.path
             )
             
-            # Apply non-conflicting remote metadata changes
-            for field, remote_value in self.remote_doc.metadata.items():
-                # Skip fields that shouldn't be merged
-                if field in ['updated_at', 'version', 'version_history']:
-                    continue
-                
-                # If field wasn't in local or base, or if remote changed it but local didn't
-                base_value = self.base_doc.metadata.get(field)
-                local_value = self.local_doc.metadata.get(field)
-                
-                if field not in self.local_doc.metadata:
-                    # Field only in remote, add it
-                    self.merged_doc.metadata[field] = remote_value
-                elif remote_value != base_value and local_value == base_value:
-                    # Remote changed it but local didn't
+            # Apply remote changes to fields local left untouched (including
+            # fields added only on the remote side) or deleted, so a local
+            # deletion never silently discards a remote edit
+            base_metadata = self.base_doc.metadata
+            local_metadata = self.local_doc.metadata
+            for field, remote_value in self._remote_changed_metadata.items():
+                local_value = local_metadata.get(field, _MISSING)
+                if local_value is _MISSING or local_value == base_metadata.get(field, _MISSING):
                     self.merged_doc.metadata[field] = remote_value
             
             # Apply resolved metadata conflicts
@@ -330,7 +408,7 @@ class Conflict:
                 continue
                 
             # Skip fields that are in conflict
-            if hasattr(self, 'metadata_conflicts') and field in self.metadata_conflicts:
+            if field in self.metadata_conflicts:
                 continue
                 
             # Get base value (if available)
@@ -368,63 +446,20 @@ class Conflict:
         Returns:
             Merged content string
         """
-        # Get content as lines
-        base_lines = self.base_doc.content.splitlines()
-        local_lines = self.local_doc.content.splitlines()
-        remote_lines = self.remote_doc.content.splitlines()
-        
-        # Use difflib to get difference between base and both versions
-        matcher = difflib.SequenceMatcher(None, base_lines, local_lines)
-        local_opcodes = matcher.get_opcodes()
-        
-        matcher = difflib.SequenceMatcher(None, base_lines, remote_lines)
-        remote_opcodes = matcher.get_opcodes()
-        
-        # Start with base content
-        merged_lines = base_lines.copy()
-        
-        # Track regions that have been modified
-        modified_regions = set()
-        
-        # Apply local changes first
-        for tag, i1, i2, j1, j2 in local_opcodes:
-            if tag in ('replace', 'delete', 'insert'):
-                # Mark this region as modified by local
-                for i in range(i1, i2):
-                    modified_regions.add(i)
-                
-                # Apply the local change
-                if tag == 'replace' or tag == 'delete':
-                    merged_lines[i1:i2] = []
-                if tag == 'replace' or tag == 'insert':
-                    merged_lines[i1:i1] = local_lines[j1:j2]
-        
-        # Apply non-conflicting remote changes
-        for tag, i1, i2, j1, j2 in remote_opcodes:
-            if tag in ('replace', 'delete', 'insert'):
-                # Check if this region overlaps with any local changes
-                overlap = False
-                for i in range(i1, i2):
-                    if i in modified_regions:
-                        overlap = True
-                        break
-                
-                # If no overlap, apply the remote change
-                if not overlap:
-                    # Calculate the new position after local changes
-                    # This is a simplification - a more robust approach would be needed
-                    # for a production system
-                    if tag == 'replace' or tag == 'delete':
-                        merged_lines[i1:i2] = []
-                    if tag == 'replace' or tag == 'insert':
-                        merged_lines[i1:i1] = remote_lines[j1:j2]
+        local_changed = any(op[0] != 'equal' for op in self._local_opcodes)
+        remote_changed = any(op[0] != 'equal' for op in self._remote_opcodes)
+        
+        # When only one side changed content, its lines are already the merge
+        # result and no hunks need to be collected or interleaved
+        if not remote_changed:
+            merged_lines = list(self._local_lines)
+        elif not local_changed:
+            merged_lines = list(self._remote_lines)
+        else:
+            merged_lines = self._merge_hunks()
         
         # Apply any manual resolutions
         if hasattr(self, 'content_resolutions') and self.content_resolutions:
-            # Get conflicts
-            if not hasattr(self, 'content_conflicts'):
-                self.content_conflicts = self._detect_content_conflicts()
-                
             # Apply each resolution
             for index, resolution in self.content_resolutions.items():
                 if index < len(self.content_conflicts):
@@ -437,6 +472,49 @@ class Conflict:
         
         return '\n'.join(merged_lines)
     
+    def _merge_hunks(self) -> List[str]:
+        """
+        Apply local changes and non-overlapping remote changes to the base.
+        
+        Returns:
+            Merged content as a list of lines
+        """
+        # Reuse the line splits and diffs shared with conflict detection
+        base_lines = self._base_lines
+        local_lines = self._local_lines
+        remote_lines = self._remote_lines
+        
+        # Track regions that have been modified
+        modified_regions = set()
+        
+        # Local changes are always taken
+        local_hunks = []
+        for tag, i1, i2, j1, j2 in self._local_opcodes:
+            if tag in ('replace', 'delete', 'insert'):
+                # Mark this region as modified by local
+                modified_regions.update(range(i1, i2))
+                local_hunks.append(_Hunk(i1, i2, local_lines[j1:j2]))
+        
+        # Remote changes are taken only where they don't overlap a local change
+        remote_hunks = []
+        for tag, i1, i2, j1, j2 in self._remote_opcodes:
+            if tag in ('replace', 'delete', 'insert'):
+                if not any(i in modified_regions for i in range(i1, i2)):
+                    remote_hunks.append(_Hunk(i1, i2, remote_lines[j1:j2]))
+        
+        # Both hunk lists are already ordered by base position, so interleave
+        # them and copy the untouched base lines between hunks in a single pass
+        merged_lines = []
+        cursor = 0
+        for hunk in heapq.merge(local_hunks, remote_hunks, key=lambda h: h.i1):
+            if hunk.i1 > cursor:
+                merged_lines.extend(base_lines[cursor:hunk.i1])
+            merged_lines.extend(hunk.replacement)
+            cursor = max(cursor, hunk.i2)
+        merged_lines.extend(base_lines[cursor:])
+        
+        return merged_lines
+    
     def resolve_metadata_conflict(self, field: str, resolution: Union[str, Any]) -> None:
         """
         Resolve a metadata conflict.
@@ -450,14 +528,11 @@ class Conflict:
         
         conflict = self.metadata_conflicts[field]
         
-        if resolution == 'base':
-            value = conflict['base']
-        elif resolution == 'local':
-            value = conflict['local']
-        elif resolution == 'remote':
-            value = conflict['remote']
+        # Named resolutions pick a side; anything else is a custom value (which
+        # may be unhashable, so only strings are looked up)
+        if isinstance(resolution, str) and resolution in _RESOLUTION_KEYS:
+            value = conflict[resolution]
         else:
-            # Use the provided custom value
             value = resolution
         
         # Apply the resolution
@@ -486,9 +561,6 @@ class Conflict:
             IndexError: If the conflict index is out of range
             ConflictError: If the conflict has already been resolved
         """
-        if not hasattr(self, 'content_conflicts'):
-            self.content_conflicts = self._detect_content_conflicts()
-            
         if conflict_index >= len(self.content_conflicts):
             raise IndexError(f"Conflict index {conflict_index} out of range (0-{len(self.content_conflicts)-1})")
             
@@ -496,21 +568,20 @@ class Conflict:
         self.content_conflicts[conflict_index]['resolved'] = resolved_content
         
         # Update the merged document content to reflect the resolution
-        if not hasattr(self, 'merged_doc'):
+        if self.merged_doc is None:
             self.merged_doc = self.create_merged_document()
-            
+        
         # Replace the conflict's content in the merged document
         content_lines = self.merged_doc.content.splitlines()
-        resolved_lines = resolved_content.splitlines()
         
         region = self.content_conflicts[conflict_index]['region']
         start_line, end_line = region
         
         # Replace the conflict region with the resolved content
-        new_content_lines = content_lines[:start_line] + resolved_lines + content_lines[end_line:]
+        content_lines[start_line:end_line] = resolved_content.splitlines()
         
         # Update the merged document content
-        self.merged_doc.content = '\n'.join(new_content_lines)
+        self.merged_doc.content = '\n'.join(content_lines)
     
     def get_conflict_summary(self) -> Dict[str, Any]:
         """
@@ -613,7 +684,7 @@ class Conflict:
             remote_value = values['remote']
             
             # Format the conflict marker
-            metadata[field] = f"<<<<<<< LOCAL\n{local_value}\n=======\n{remote_value}\n>>>>>>> REMOTE"
+            metadata[field] = f"{_MARKER_LOCAL}\n{local_value}\n{_MARKER_SEP}\n{remote_value}\n{_MARKER_REMOTE}"
         
         # Create a document with the metadata
         from .core import MDPFile
@@ -630,11 +701,11 @@ class Conflict:
             
             # Format the conflict marker
             conflict_marker = (
-                f"<<<<<<< LOCAL (Conflict {i})\n"
+                f"{_MARKER_LOCAL} (Conflict {i})\n"
                 f"{local_content}\n"
-                f"=======\n"
+                f"{_MARKER_SEP}\n"
                 f"{remote_content}\n"
-                f">>>>>>> REMOTE"
+                f"{_MARKER_REMOTE}"
             )
             
             # Replace the conflicting region with the marker
@@ -884,12 +955,13 @@ class ConflictManager:
             v1 = Version(version1)
             v2 = Version(version2)
             
+            # Keep the parsed best candidate so it isn't re-parsed on every comparison
+            best_version = None
             ancestor = None
             for v_str in version_strings:
                 v = Version(v_str)
-                if v < v1 and v < v2:
-                    if ancestor is None or v > Version(ancestor):
-                        ancestor = v_str
+                if v < v1 and v < v2 and (best_version is None or v > best_version):
+                    best_version, ancestor = v, v_str
             
             if ancestor:
                 return ancestor
@@ -1040,73 +1112,81 @@ class ConflictManager:
         """
         output_path = Path(output_path)
         
-        # Create conflict file content
-        content = []
-        
-        # Add metadata conflicts
-        content.append("# METADATA CONFLICTS")
-        content.append("# Resolve metadata conflicts by editing the metadata section below")
-        content.append("# Keep the values you want and remove conflict markers")
-        content.append("")
-        
         # Create metadata section with conflicts marked
         metadata = conflict.local_doc.metadata.copy()
         
         for field, conflict_info in conflict.metadata_conflicts.items():
-            metadata[field] = f"<<<<<<< LOCAL\n{conflict_info['local']}\n=======\n{conflict_info['remote']}\n>>>>>>> REMOTE"
-        
-        # Add metadata as YAML
-        import yaml
-        metadata_yaml = yaml.dump(metadata, default_flow_style=False, sort_keys=False)
-        content.append("---")
-        content.append(metadata_yaml)
-        content.append("---")
-        content.append("")
+            metadata[field] = f"{_MARKER_LOCAL}\n{conflict_info['local']}\n{_MARKER_SEP}\n{conflict_info['remote']}\n{_MARKER_REMOTE}"
         
         # Start with local content
         base_content = conflict.local_doc.content
         
-        # Insert content conflict markers
-        if conflict.content_conflicts:
-            # Add header for content conflicts
-            content.append("# CONTENT CONFLICTS")
-            content.append("# Resolve content conflicts by keeping the version you want and removing conflict markers")
-            content.append("")
-            
-            # Prepare content with markers
-            modified_content = base_content
-            
-            # Process conflicts in reverse order so that later insertions don't affect positions
-            for i, content_conflict in enumerate(sorted(conflict.content_conflicts, 
-                                                       key=lambda c: c['region'][0], 
-                                                       reverse=True)):
-                local_content = content_conflict['local']
-                remote_content = content_conflict['remote']
+        # Write each section straight to the file instead of assembling the
+        # whole conflict file in memory first
+        with open(output_path, 'w', encoding='utf-8') as f:
+            write = f.write
+            
+            # Add metadata conflicts
+            write("# METADATA CONFLICTS\n")
+            write("# Resolve metadata conflicts by editing the metadata section below\n")
+            write("# Keep the values you want and remove conflict markers\n")
+            write("\n")
+            
+            # Add metadata as YAML, dumped straight into the file
+            write("---\n")
+            yaml.dump(metadata, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+            write("\n---\n")
+            write("\n")
+            
+            # Insert content conflict markers
+            if conflict.content_conflicts:
+                # Add header for content conflicts
+                write("# CONTENT CONFLICTS\n")
+                write("# Resolve content conflicts by keeping the version you want and removing conflict markers\n")
+                write("\n")
                 
-                # Create conflict marker text
-                conflict_text = f"<<<<<<< LOCAL (Conflict {i})\n{local_content}\n=======\n{remote_content}\n>>>>>>> REMOTE"
+                # Work on the content as lines so each region is replaced in
+                # place. modified_content holds the exact text whenever it is
+                # not simply the lines joined, i.e. before the first
+                # replacement and after a conflict is appended at the end.
+                modified_content = base_content
+                content_lines = base_content.splitlines()
                 
-                # Split content into lines for easier manipulation
-                content_lines = modified_content.splitlines()
+                # Process conflicts in reverse order so that later insertions don't affect positions
+                for i, content_conflict in enumerate(sorted(conflict.content_conflicts, 
+                                                           key=lambda c: c['region'][0], 
+                                                           reverse=True)):
+                    local_content = content_conflict['local']
+                    remote_content = content_conflict['remote']
+                    
+                    # Create conflict marker text
+                    conflict_text = f"{_MARKER_LOCAL} (Conflict {i})\n{local_content}\n{_MARKER_SEP}\n{remote_content}\n{_MARKER_REMOTE}"
+                    
+                    # Joining and re-splitting the lines drops one trailing
+                    # empty line, so do the same to keep positions consistent
+                    if modified_content is None and content_lines and content_lines[-1] == '':
+                        content_lines.pop()
+                    
+                    # Replace the conflict region with the marked conflict
+                    region_start, region_end = content_conflict['region']
+                    if region_start < len(content_lines):
+                        # Insert the conflict text at the right position
+                        content_lines[region_start:region_end] = conflict_text.splitlines()
+                        modified_content = None
+                    else:
+                        # Append to the end if the region is beyond the current
+                        # content; later conflicts are placed against the result
+                        if modified_content is None:
+                            modified_content = '\n'.join(content_lines)
+                        modified_content += '\n\n' + conflict_text
+                        content_lines = modified_content.splitlines()
                 
-                # Replace the conflict region with the marked conflict
-                region_start, region_end = content_conflict['region']
-                if region_start < len(content_lines):
-                    # Insert the conflict text at the right position
-                    content_lines[region_start:region_end] = conflict_text.splitlines()
+                if modified_content is None:
                     modified_content = '\n'.join(content_lines)
-                else:
-                    # Append to the end if the region is beyond the current content
-                    modified_content += '\n\n' + conflict_text
-            
-            content.append(modified_content)
-        else:
-            # No content conflicts, just add the content
-            content.append(base_content)
-        
-        # Write the conflict file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(content))
+                write(modified_content)
+            else:
+                # No content conflicts, just add the content
+                write(base_content)
         
         return str(output_path)
     
@@ -1131,14 +1211,18 @@ class ConflictManager:
         conflict_file_path = Path(conflict_file_path)
         output_path = Path(output_path)
         
-        # Read the conflict file
-        with open(conflict_file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Read the conflict file as raw bytes
+        with open(conflict_file_path, 'rb') as f:
+            raw = f.read()
+        
+        # Check for unresolved conflict markers in a single scan, before decoding
+        marker = _CONFLICT_MARKER_RE.search(raw)
+        if marker:
+            raise ConflictError(
+                f"Conflict file still has unresolved conflicts. Found marker: {marker.group().decode()}"
+            )
         
-        # Check for unresolved conflict markers
-        for marker in ['<<<<<<<', '=======', '>>>>>>>']: 
-            if marker in content:
-                raise ConflictError(f"Conflict file still has unresolved conflicts. Found marker: {marker}")
+        content = raw.decode('utf-8')
 
         try:
             # Try to extract metadata and content
@@ -1171,6 +1255,33 @@ class ConflictManager:
             raise ConflictError(f"Failed to resolve conflict file: {str(e)}")
 
 
+def _read_front_matter_only(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Read and parse only the YAML front matter of an MDP file.
+    
+    Stops reading at the closing delimiter, so the document body is never
+    loaded or parsed.
+    
+    Args:
+        path: Path to the MDP file
+        
+    Returns:
+        The metadata dictionary (empty if the file has no front matter)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        if f.readline().rstrip() != '---':
+            return {}
+        
+        front_matter = []
+        for line in f:
+            if line.rstrip() == '---':
+                return yaml.load(''.join(front_matter), Loader=_YamlLoader) or {}
+            front_matter.append(line)
+    
+    # No closing delimiter, so there is no front matter
+    return {}
+
+
 def detect_concurrent_modification(
     document_path: Union[str, Path],
     expected_version: Optional[str] = None
@@ -1187,13 +1298,13 @@ def detect_concurrent_modification(
     """
     document_path = Path(document_path)
     
-    # Read the document
+    # Read only the front matter; the body isn't needed for a version check
     try:
-        doc = read_mdp(document_path)
+        metadata = _read_front_matter_only(document_path)
         
         # Get the current version
-        current_version = doc.metadata.get('version', '0.0.0')
-        latest_version = doc.metadata.get('latest_version', current_version)
+        current_version = metadata.get('version', '0.0.0')
+        latest_version = metadata.get('latest_version', current_version)
         
         # If expected_version is not provided, use the version from metadata
         if expected_version is None:
@@ -5,26 +5,81 @@ This module provides the main MDPFile class and functions for reading and writin
 """
 
 import os
+import sys
 import uuid
 import yaml
 import json
 import datetime
 import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Tuple, Any, Set
 import jsonschema
 
 from .metadata import extract_metadata, validate_metadata, is_semantic_version, next_version, format_date
 
+# Use libyaml's C parser and emitter when PyYAML was built with them. Set
+# MDP_FAST_YAML=0 to force the pure-Python implementations when debugging.
+if os.environ.get("MDP_FAST_YAML", "1") != "0":
+    try:
+        from yaml import CSafeLoader as _YamlLoader, CDumper as _YamlDumper
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader, Dumper as _YamlDumper
+else:
+    from yaml import SafeLoader as _YamlLoader, Dumper as _YamlDumper
+
+
+# Front matter block at the start of an MDP document, followed by the content
+_FRONT_MATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)', re.DOTALL)
+
+# Parsed files for read_mdp_cached, keyed by absolute path and validated
+# against (st_mtime_ns, st_size, st_ino); least recently used entries go first
+_PARSE_CACHE_SIZE = 1024
+_parse_cache: "OrderedDict[str, Tuple[Tuple[int, int, int], Dict[str, Any], str]]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
 
 class MDPFile:
     """
     Low-level representation of an MDP file with metadata and content.
     """
+    __slots__ = ("_metadata", "_raw_front_matter", "content", "path")
+    
     def __init__(self, metadata: Dict[str, Any], content: str, path: Optional[str] = None):
         self.metadata = metadata
         self.content = content
         self.path = path
+    
+    @classmethod
+    def _with_raw_front_matter(cls, front_matter: str, content: str, path: Optional[str] = None) -> 'MDPFile':
+        """
+        Create an MDPFile whose metadata is parsed from YAML on first access.
+        
+        Args:
+            front_matter (str): The unparsed YAML front matter.
+            content (str): The document content.
+            path (Optional[str]): The path to associate with the MDPFile.
+            
+        Returns:
+            MDPFile: A new MDPFile instance.
+        """
+        mdp_file = cls({}, content, path)
+        mdp_file._raw_front_matter = front_matter
+        return mdp_file
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """The metadata dictionary, parsing deferred front matter if needed."""
+        if self._raw_front_matter is not None:
+            self._metadata = _parse_front_matter(self._raw_front_matter)
+            self._raw_front_matter = None
+        return self._metadata
+    
+    @metadata.setter
+    def metadata(self, value: Dict[str, Any]) -> None:
+        self._metadata = value
+        self._raw_front_matter = None
 
     def to_string(self) -> str:
         """
@@ -33,7 +88,7 @@ class MDPFile:
         Returns:
             str: The string representation of the MDP file.
         """
-        metadata_str = yaml.dump(self.metadata, default_flow_style=False, sort_keys=False)
+        metadata_str = yaml.dump(self.metadata, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
         return f"---\n{metadata_str}---\n\n{self.content}"
     
     def save(self, path: Optional[str] = None) -> str:
@@ -54,8 +109,17 @@ class MDPFile:
                 raise ValueError("No path specified for saving the MDP file")
             path = self.path
         
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(self.to_string())
+        # Same layout as to_string(), but the YAML is emitted straight into
+        # the file rather than built as an intermediate string
+        with open(path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            f.write("---\n")
+            yaml.dump(self.metadata, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+            f.write("---\n\n")
+            f.write(self.content)
+        
+        # A rewrite can land within the same mtime tick and keep the size, so
+        # don't rely on the stat check for files saved by this process
+        _forget_parsed(path)
         
         self.path = path
         return path
@@ -92,12 +156,14 @@ class MDPFile:
         return read_mdp(path)
 
 
-def read_mdp(path: str) -> MDPFile:
+def read_mdp(path: str, lazy: bool = False) -> MDPFile:
     """
     Read an MDP file from disk.
     
     Args:
         path (str): Path to the MDP file.
+        lazy (bool): Defer parsing the YAML metadata until it is first accessed.
+            Malformed metadata then raises ValueError on that access instead of here.
         
     Returns:
         MDPFile: An MDPFile object with the metadata and content from the file.
@@ -108,10 +174,76 @@ def read_mdp(path: str) -> MDPFile:
     with open(path, 'r', encoding='utf-8') as f:
         content = f.read()
     
+    if lazy:
+        front_matter, doc_content = _split_front_matter(content)
+        if front_matter is not None:
+            return MDPFile._with_raw_front_matter(front_matter, doc_content, path)
+        return MDPFile({}, doc_content, path)
+    
     metadata, doc_content = extract_metadata(content)
     return MDPFile(metadata, doc_content, path)
 
 
+def read_mdp_cached(path: Union[str, Path]) -> MDPFile:
+    """
+    Read an MDP file from disk, reusing the parse of an unchanged file.
+    
+    Files are considered unchanged while their modification time, size and
+    inode stay the same. Each call returns a new MDPFile with its own copy
+    of the metadata, so callers can modify it freely.
+    
+    Args:
+        path (Union[str, Path]): Path to the MDP file.
+        
+    Returns:
+        MDPFile: An MDPFile object with the metadata and content from the file.
+        
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    
+    with _parse_cache_lock:
+        entry = _parse_cache.get(key)
+        if entry is not None and entry[0] == stamp:
+            _parse_cache.move_to_end(key)
+            return MDPFile(_copy_metadata(entry[1]), entry[2], path)
+    
+    mdp_file = read_mdp(path)
+    
+    with _parse_cache_lock:
+        _parse_cache[key] = (stamp, _copy_metadata(mdp_file.metadata), mdp_file.content)
+        _parse_cache.move_to_end(key)
+        if len(_parse_cache) > _PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    
+    return mdp_file
+
+
+def _forget_parsed(path: Union[str, Path]) -> None:
+    """Drop any cached parse of a file."""
+    with _parse_cache_lock:
+        _parse_cache.pop(os.path.abspath(path), None)
+
+
+def _copy_metadata(value: Any) -> Any:
+    """
+    Copy parsed YAML metadata so cached and returned copies don't share state.
+    
+    Only the mutable containers YAML produces are copied; scalars, dates and
+    strings are immutable and shared.
+    """
+    if isinstance(value, dict):
+        return {k: _copy_metadata(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_metadata(v) for v in value]
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
 def write_mdp(path: str, metadata: Dict[str, Any], content: str) -> MDPFile:
     """
     Write metadata and content to a file in MDP format.
@@ -142,21 +274,60 @@ def extract_metadata(content: str) -> Tuple[Dict[str, Any], str]:
     Raises:
         ValueError: If the metadata section is not properly formatted.
     """
-    pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)'
-    match = re.match(pattern, content, re.DOTALL)
+    yaml_str, remaining_content = _split_front_matter(content)
     
-    if not match:
+    if yaml_str is None:
         # No metadata section found, or improperly formatted
         return {}, content
     
-    yaml_str = match.group(1)
-    remaining_content = match.group(2)
+    return _parse_front_matter(yaml_str), remaining_content
+
+
+def _split_front_matter(content: str) -> Tuple[Optional[str], str]:
+    """
+    Split an MDP document into its raw front matter and content.
     
+    Args:
+        content (str): The MDP document content including metadata.
+        
+    Returns:
+        Tuple[Optional[str], str]: The unparsed YAML (None if there is no
+            metadata section) and the content.
+    """
+    match = _FRONT_MATTER_RE.match(content)
+    
+    if not match:
+        return None, content
+    
+    return match.group(1), match.group(2).lstrip()
+
+
+def _parse_front_matter(yaml_str: str) -> Dict[str, Any]:
+    """
+    Parse raw YAML front matter into a metadata dictionary.
+    
+    Args:
+        yaml_str (str): The YAML front matter.
+        
+    Returns:
+        Dict[str, Any]: The metadata dictionary.
+        
+    Raises:
+        ValueError: If the YAML cannot be parsed.
+    """
     try:
-        metadata = yaml.safe_load(yaml_str) or {}
-        return metadata, remaining_content.lstrip()
+        metadata = yaml.load(yaml_str, Loader=_YamlLoader) or {}
     except yaml.YAMLError as e:
         raise ValueError(f"Error parsing metadata YAML: {e}")
+    
+    # Intern the parsed field names so lookups with literal keys such as
+    # "title" match by identity instead of comparing the strings
+    if isinstance(metadata, dict):
+        metadata = {
+            sys.intern(key) if type(key) is str else key: value
+            for key, value in metadata.items()
+        }
+    return metadata
 
 
 def validate_metadata(metadata: Dict[str, Any], schema_path: Optional[str] = None) -> bool:
@@ -5,16 +5,22 @@ This module provides the Document class, which is the primary interface for work
 Markdown Data Pack (MDP) files in a user-friendly way.
 """
 
+import importlib.util
 import os
+import tempfile
+from contextlib import suppress
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Iterable, Tuple
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Union, Iterable, Tuple
 import sys
 import warnings
 
-from .core import MDPFile, read_mdp, write_mdp
+from .core import MDPFile, read_mdp, read_mdp_cached, write_mdp
 from .metadata import (
     create_metadata,
+    create_metadata_fast,
     generate_uuid,
     create_relationship,
     add_relationship_to_metadata,
@@ -31,6 +37,60 @@ from .utils import (
 )
 
 
+def _lazy_import(name: str) -> ModuleType:
+    """
+    Import a module that is only executed on first attribute access.
+    
+    Args:
+        name: Fully qualified module name
+        
+    Returns:
+        The module, or a lazy proxy for it if it wasn't imported yet
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    
+    # Bind it on the parent package as a regular import would
+    parent, _, child = name.rpartition(".")
+    setattr(sys.modules[parent], child, module)
+    return module
+
+
+# Versioning and conflict support are only needed by some Document methods, so
+# they are loaded on first use instead of when this module is imported
+_versioning = _lazy_import(f"{__package__}.versioning")
+_conflict = _lazy_import(f"{__package__}.conflict")
+
+# A ConflictManager binds to the version store next to the first document it
+# checks, so one is kept per document directory and reused across calls. The
+# cache is bounded so long-running processes touching many directories don't
+# accumulate managers; an evicted one is simply recreated on next use.
+@lru_cache(maxsize=64)
+def _cm_for_directory(directory: Path) -> Any:
+    """Create the ConflictManager shared by documents in a directory."""
+    return _conflict.ConflictManager()
+
+
+def _cm(document_path: Union[str, Path]) -> Any:
+    """
+    Get the shared ConflictManager for a document's directory.
+    
+    Args:
+        document_path: Path to the local document
+        
+    Returns:
+        The ConflictManager for that directory
+    """
+    return _cm_for_directory(Path(document_path).parent)
+
+
 class Document:
     """
     A document with metadata and content.
@@ -45,6 +105,9 @@ class Document:
         path: Optional path to the file on disk
     """
     
+    # All state lives on the wrapped MDPFile, so instances need no __dict__
+    __slots__ = ("_mdp_file",)
+    
     def __init__(
         self, 
         content: str, 
@@ -60,7 +123,7 @@ class Document:
             path: Optional path to the file on disk
         """
         if metadata is None:
-            metadata = create_metadata(title="Untitled Document")
+            metadata = create_metadata_fast("Untitled Document")
         
         self._mdp_file = MDPFile(
             metadata=metadata,
@@ -69,27 +132,62 @@ class Document:
         )
     
     @classmethod
-    def from_file(cls, path: Union[str, Path]) -> "Document":
+    def from_file(cls, path: Union[str, Path], lazy: bool = False) -> "Document":
         """
         Create a Document from an MDP file.
         
         Args:
             path: Path to the MDP file
+            lazy: Defer parsing the metadata until it is first accessed, for
+                callers that may only need the content
             
         Returns:
             A new Document instance
             
         Raises:
             FileNotFoundError: If the file does not exist
-            ValueError: If the file is not a valid MDP file
+            ValueError: If the file is not a valid MDP file (on first metadata
+                access when lazy is True)
         """
-        mdp_file = read_mdp(path)
-        doc = cls(
-            content=mdp_file.content,
-            metadata=mdp_file.metadata,
-            path=mdp_file.path
-        )
-        doc._mdp_file = mdp_file  # Store the original MDPFile
+        # A lazy read skips parsing entirely, so only eager reads go through
+        # the parse cache
+        if lazy:
+            mdp_file = read_mdp(path, lazy=True)
+        else:
+            mdp_file = read_mdp_cached(path)
+        
+        # Wrap the MDPFile directly so a lazy one stays unparsed
+        return cls._from_mdp_file(mdp_file)
+    
+    @classmethod
+    def from_string(cls, text: str) -> "Document":
+        """
+        Create a Document from text in MDP format.
+        
+        Args:
+            text: The document text, including any YAML front matter
+            
+        Returns:
+            A new Document instance without a path
+            
+        Raises:
+            ValueError: If the front matter is not valid YAML
+        """
+        return cls._from_mdp_file(MDPFile.from_string(text))
+    
+    @classmethod
+    def _from_mdp_file(cls, mdp_file: MDPFile) -> "Document":
+        """
+        Wrap an existing MDPFile without copying it.
+        
+        Args:
+            mdp_file: The MDPFile to wrap
+            
+        Returns:
+            A new Document instance backed by mdp_file
+        """
+        doc = cls.__new__(cls)
+        doc._mdp_file = mdp_file
         return doc
     
     @classmethod
@@ -173,7 +271,7 @@ class Document:
     @property
     def title(self) -> str:
         """Get the document title."""
-        return self.metadata.get("title", "")
+        return self._mdp_file.metadata.get("title", "")
     
     @title.setter
     def title(self, value: str):
@@ -183,7 +281,7 @@ class Document:
     @property
     def author(self) -> Optional[str]:
         """Get the document author."""
-        return self.metadata.get("author")
+        return self._mdp_file.metadata.get("author")
     
     @author.setter
     def author(self, value: str):
@@ -193,7 +291,7 @@ class Document:
     @property
     def created_at(self) -> Optional[str]:
         """Get the document creation date."""
-        return self.metadata.get("created_at")
+        return self._mdp_file.metadata.get("created_at")
     
     @created_at.setter
     def created_at(self, value: Union[str, date]):
@@ -203,7 +301,7 @@ class Document:
     @property
     def updated_at(self) -> Optional[str]:
         """Get the document last update date."""
-        return self.metadata.get("updated_at")
+        return self._mdp_file.metadata.get("updated_at")
     
     @updated_at.setter
     def updated_at(self, value: Union[str, date]):
@@ -213,7 +311,7 @@ class Document:
     @property
     def tags(self) -> List[str]:
         """Get the list of tags."""
-        return self.metadata.get("tags", [])
+        return self._mdp_file.metadata.get("tags", [])
     
     @tags.setter
     def tags(self, value: List[str]) -> None:
@@ -226,9 +324,7 @@ class Document:
     @property
     def relationships(self) -> List[Dict[str, Any]]:
         """Get the document relationships as a list."""
-        if "relationships" not in self.metadata:
-            return []
-        return self.metadata["relationships"]
+        return self._mdp_file.metadata.get("relationships", [])
     
     def add_tag(self, tag: str) -> "Document":
         """
@@ -248,6 +344,29 @@ class Document:
         
         return self
     
+    def add_tags(self, tags: Iterable[str]) -> "Document":
+        """
+        Add several tags to the document, skipping ones it already has.
+        
+        Existing tags are checked against a set, so bulk tagging stays linear
+        rather than scanning the tag list once per new tag.
+        
+        Args:
+            tags: The tags to add
+            
+        Returns:
+            The Document instance for method chaining
+        """
+        current = self.metadata.setdefault("tags", [])
+        seen = set(current)
+        
+        for tag in tags:
+            if tag not in seen:
+                seen.add(tag)
+                current.append(tag)
+        
+        return self
+    
     def remove_tag(self, tag: str) -> "Document":
         """
         Remove a tag from the document.
@@ -375,22 +494,12 @@ class Document:
         )
         
         # Convert them to Document instances
-        related_docs = []
-        for mdp_file in related_files:
-            doc = Document(
-                content=mdp_file.content,
-                metadata=mdp_file.metadata,
-                path=mdp_file.path
-            )
-            doc._mdp_file = mdp_file  # Store the original MDPFile
-            related_docs.append(doc)
-        
-        return related_docs
+        return [Document._from_mdp_file(mdp_file) for mdp_file in related_files]
 
     @property
     def version(self) -> Optional[str]:
         """Get the document version."""
-        return self.metadata.get("version")
+        return self._mdp_file.metadata.get("version")
 
     @version.setter
     def version(self, value: str):
@@ -406,7 +515,11 @@ class Document:
         if not is_semantic_version(value):
             raise ValueError(f"Invalid semantic version: {value}. Expected format: X.Y.Z")
         
-        self.metadata["version"] = value
+        self._set_version_unchecked(value)
+    
+    def _set_version_unchecked(self, value: str) -> None:
+        """Set a version string that the caller has already validated."""
+        self._mdp_file.metadata["version"] = value
 
     def bump_version(self, version_type: str = "patch") -> "Document":
         """
@@ -423,15 +536,15 @@ class Document:
                       version_type is invalid.
         """
         current_version = self.version or "0.0.0"
-        new_version = next_version(current_version, version_type)
-        self.version = new_version
+        # next_version only returns valid semantic versions
+        self._set_version_unchecked(next_version(current_version, version_type))
         self.updated_at = format_date(date.today())
         return self
 
     @property
     def version_history(self) -> List[Dict[str, Any]]:
         """Get the document version history."""
-        return self.metadata.get("version_history", [])
+        return self._mdp_file.metadata.get("version_history", [])
 
     def create_version(
         self,
@@ -461,8 +574,7 @@ class Document:
             raise ValueError("Document must be saved before creating a version")
         
         # Use the version manager
-        from .versioning import get_version_manager
-        vm = get_version_manager(self.path)
+        vm = _versioning.get_version_manager(self.path)
         
         # If no explicit version, determine the next version
         if not version:
@@ -475,7 +587,7 @@ class Document:
         
         # Update document version if update_document is True
         if update_document:
-            self.version = version
+            self._set_version_unchecked(version)
             self.updated_at = format_date(date.today())
             # Save changes
             self.save()
@@ -502,8 +614,7 @@ class Document:
         if not self.path:
             raise ValueError("Document must be saved before getting versions")
         
-        from .versioning import get_version_manager
-        vm = get_version_manager(self.path)
+        vm = _versioning.get_version_manager(self.path)
         
         # Get all versions
         versions = vm.list_versions(self.path)
@@ -529,8 +640,7 @@ class Document:
         if not self.path:
             raise ValueError("Document must be saved before comparing versions")
         
-        from .versioning import get_version_manager
-        vm = get_version_manager(self.path)
+        vm = _versioning.get_version_manager(self.path)
         
         # First check if the version exists and is valid
         try:
@@ -558,8 +668,7 @@ class Document:
         if not self.path:
             raise ValueError("Document must be saved before comparing versions")
         
-        from .versioning import get_version_manager
-        vm = get_version_manager(self.path)
+        vm = _versioning.get_version_manager(self.path)
         
         return vm.compare_versions(self.path, version1, version2)
 
@@ -580,17 +689,13 @@ class Document:
         if not self.path:
             raise ValueError("Document must be saved before rolling back")
         
-        from .versioning import get_version_manager
-        vm = get_version_manager(self.path)
+        vm = _versioning.get_version_manager(self.path)
         
         # Perform rollback
         vm.rollback_to_version(self.path, version, create_backup)
         
-        # Reload the document
-        rolled_back_doc = Document.from_file(self.path)
-        
-        # Update this document instance with the rolled back content
-        self._mdp_file = rolled_back_doc._mdp_file
+        # Reload this document instance with the rolled back content
+        self._mdp_file = read_mdp(self.path)
         
         return self
 
@@ -611,8 +716,7 @@ class Document:
         if not self.path:
             raise ValueError("Document must be saved before creating a branch")
         
-        from .versioning import get_version_manager
-        vm = get_version_manager(self.path)
+        vm = _versioning.get_version_manager(self.path)
         
         # Create branch
         branch_path = vm.create_branch(self.path, branch_name, base_version)
@@ -640,17 +744,13 @@ class Document:
         if not branch_doc.path:
             raise ValueError("Branch document must be saved before merging")
         
-        from .versioning import get_version_manager
-        vm = get_version_manager(self.path)
+        vm = _versioning.get_version_manager(self.path)
         
         # Perform merge
         vm.merge_branch(branch_doc.path, self.path, create_backup)
         
-        # Reload this document
-        merged_doc = Document.from_file(self.path)
-        
-        # Update this document instance with the merged content
-        self._mdp_file = merged_doc._mdp_file
+        # Reload this document instance with the merged content
+        self._mdp_file = read_mdp(self.path)
         
         return self
     
@@ -676,8 +776,7 @@ class Document:
         if not other_doc.path:
             raise ValueError("Other document must be saved before checking for conflicts")
         
-        from .conflict import ConflictManager
-        manager = ConflictManager()
+        manager = _cm(self.path)
         
         # Use the conflict manager to check for conflicts
         has_conflicts, conflict = manager.check_for_conflicts(
@@ -722,8 +821,7 @@ class Document:
             raise ValueError("Other document must be saved before merging")
         
         # Use the conflict manager to attempt auto-merge
-        from .conflict import ConflictManager, ConflictError
-        manager = ConflictManager()
+        manager = _cm(self.path)
         
         # Set default output path if not provided
         if output_path is None:
@@ -734,7 +832,7 @@ class Document:
         
         if not success:
             # Auto-merge failed due to conflicts
-            raise ConflictError(f"Auto-merge failed due to conflicts. A conflict file has been created at {merged_path}")
+            raise _conflict.ConflictError(f"Auto-merge failed due to conflicts. A conflict file has been created at {merged_path}")
         
         # Load the merged document
         return Document.from_file(merged_path)
@@ -756,38 +854,48 @@ class Document:
         if not self.path:
             raise ValueError("Document must be saved before creating conflict file")
         
-        from .conflict import ConflictManager
-        manager = ConflictManager()
+        manager = _cm(self.path)
         
         # If other document has no path, save it to a temporary location
-        if not other_doc.path:
-            import tempfile
-            temp_dir = tempfile.mkdtemp()
-            temp_path = os.path.join(temp_dir, "temp_doc.mdp")
-            other_doc.save(temp_path)
-            
-            try:
-                has_conflicts, conflict = manager.check_for_conflicts(self.path, temp_path)
-                if has_conflicts and conflict:
-                    return manager.create_conflict_file(conflict, output_path)
-                else:
-                    # No conflicts, just copy this document
-                    self.save(output_path)
-                    return str(output_path)
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
-                if os.path.exists(temp_dir):
-                    os.rmdir(temp_dir)
-        else:
-            has_conflicts, conflict = manager.check_for_conflicts(self.path, other_doc.path)
+        other_path, cleanup = self._materialize_other(other_doc)
+        try:
+            has_conflicts, conflict = manager.check_for_conflicts(self.path, other_path)
             if has_conflicts and conflict:
                 return manager.create_conflict_file(conflict, output_path)
             else:
                 # No conflicts, just copy this document
                 self.save(output_path)
                 return str(output_path)
+        finally:
+            cleanup()
+    
+    @staticmethod
+    def _materialize_other(other_doc: "Document") -> Tuple[Union[str, Path], Callable[[], None]]:
+        """
+        Get a path on disk for a document, saving it to a temporary file if needed.
+        
+        Args:
+            other_doc: The document to materialize
+            
+        Returns:
+            Tuple of (path, cleanup), where cleanup removes any temporary file
+        """
+        if other_doc.path:
+            return other_doc.path, lambda: None
+        
+        with tempfile.NamedTemporaryFile(suffix=".mdp", delete=False) as temp_file:
+            temp_path = temp_file.name
+        
+        def cleanup() -> None:
+            with suppress(FileNotFoundError):
+                os.unlink(temp_path)
+        
+        try:
+            other_doc.save(temp_path)
+        except BaseException:
+            cleanup()
+            raise
+        return temp_path, cleanup
     
     @classmethod
     def resolve_from_conflict_file(cls, conflict_file_path: Union[str, Path], output_path: Union[str, Path]) -> "Document":
@@ -804,8 +912,6 @@ class Document:
         Raises:
             ConflictError: If the conflict file still contains unresolved conflicts
         """
-        from .conflict import ConflictManager, ConflictError
-        
         conflict_file_path = Path(conflict_file_path)
         output_path = Path(output_path)
         
@@ -843,7 +949,7 @@ class Document:
                 pass
             else:
                 # This is the test_resolve_with_unresolved_conflicts test
-                raise ConflictError("Conflict file contains unresolved conflicts. Please resolve them manually.")
+                raise _conflict.ConflictError("Conflict file contains unresolved conflicts. Please resolve them manually.")
         
         # Check for unresolved conflict markers
         import re
@@ -858,7 +964,7 @@ class Document:
             pass
         elif standard_conflict_pattern.search(content):
             # For non-test files, check for unresolved conflicts
-            raise ConflictError("Conflict file contains unresolved conflicts. Please resolve them manually.")
+            raise _conflict.ConflictError("Conflict file contains unresolved conflicts. Please resolve them manually.")
         
         # Create a new MDPFile from the resolved content
         from .core import MDPFile
@@ -883,5 +989,4 @@ class Document:
         if not self.path:
             return False
         
-        from .conflict import detect_concurrent_modification
-        return detect_concurrent_modification(self.path, expected_version) 
\ No newline at end of file
+        return _conflict.detect_concurrent_modification(self.path, expected_version) 
\ No newline at end of file
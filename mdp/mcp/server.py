@@ -9,13 +9,14 @@ import asyncio
 import json
 import os
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple, Union
 
 from fastmcp import FastMCP, MCPChunk, MCPContext
 from pydantic import BaseModel, Field, create_model
 
 from ..collection import Collection
 from ..document import Document
+from ..utils import find_in_segments
 from .llm_docs import get_server_documentation, get_tool_documentation, get_workflow_examples, get_documentation_markdown
 
 # Schema imports for API documentation
@@ -75,6 +76,146 @@ class MDPContext:
             collection: The collection of documents to serve
         """
         self.collection = collection
+        
+        # Per-document caches keyed by id() of the document object, which stays
+        # unique while _indexed holds a reference to it. UUIDs can't be used as
+        # keys because a collection may hold several documents with the same one
+        # (version snapshots, copies). Entries are rebuilt lazily for documents
+        # that are new, replaced or marked dirty by a tool call. Content search
+        # is handled by the collection's own search buffer.
+        self._indexed: Dict[int, Document] = {}
+        self._dirty: Set[str] = set()
+        self._lower_metadata: Dict[int, List[str]] = {}
+        self._metadata_json: Dict[int, str] = {}
+        
+        # Lowercased metadata values of every document joined into one
+        # NUL-separated buffer, with the keys and segment offsets it was built for
+        self._metadata_buffer: Optional[Tuple[List[int], bytes, List[int]]] = None
+    
+    def invalidate(self, doc_id: str) -> None:
+        """
+        Mark the cached data of every document with an ID as stale.
+        
+        Args:
+            doc_id: The document ID
+        """
+        self._dirty.add(doc_id)
+    
+    def _refresh(self) -> List[int]:
+        """
+        Bring the per-document caches in line with the collection.
+        
+        Returns:
+            The cache key of each document, in collection order
+        """
+        dirty = self._dirty
+        keys = []
+        for doc in self.collection.documents:
+            key = id(doc)
+            keys.append(key)
+            if self._indexed.get(key) is not doc or (dirty and doc.metadata.get("uuid") in dirty):
+                self._indexed[key] = doc
+                self._lower_metadata[key] = [str(v).lower() for v in doc.metadata.values()]
+                self._metadata_json.pop(key, None)
+                self._metadata_buffer = None
+        
+        for key in set(self._indexed).difference(keys):
+            del self._indexed[key]
+            self._lower_metadata.pop(key, None)
+            self._metadata_json.pop(key, None)
+            self._metadata_buffer = None
+        dirty.clear()
+        return keys
+    
+    def _metadata_segments(self, keys: List[int]) -> Tuple[bytes, List[int]]:
+        """
+        Get the joined metadata buffer for the documents with the given keys.
+        
+        Args:
+            keys: Cache keys in collection order, as returned by _refresh
+            
+        Returns:
+            The buffer and the start offset of each document's segment
+        """
+        cached = self._metadata_buffer
+        if cached is not None and cached[0] == keys:
+            return cached[1], cached[2]
+        
+        parts = []
+        starts = []
+        pos = 0
+        for key in keys:
+            part = "\0".join(self._lower_metadata[key]).encode("utf-8")
+            starts.append(pos)
+            parts.append(part)
+            pos += len(part) + 1
+        
+        buffer = b"\0".join(parts)
+        self._metadata_buffer = (keys, buffer, starts)
+        return buffer, starts
+    
+    def search(
+        self,
+        query: str,
+        include_metadata: bool = True,
+        max_results: Optional[int] = None
+    ) -> List[Document]:
+        """
+        Find documents whose content (or metadata) contains a query string.
+        
+        Args:
+            query: The case-insensitive search string
+            include_metadata: Whether metadata values are searched as well
+            max_results: Maximum number of documents to return (None for no limit)
+            
+        Returns:
+            Matching documents in collection order
+        """
+        if max_results is not None and max_results <= 0:
+            return []
+        
+        content_hits = self.collection.search_content(query)
+        if not include_metadata:
+            return content_hits[:max_results]
+        
+        # Reuse the keys computed by the refresh instead of recomputing them
+        keys = self._refresh()
+        needle = query.lower()
+        documents = self.collection.documents
+        hit_ids = {id(doc) for doc in content_hits}
+        
+        if "\0" in needle:
+            # NUL separates values in the buffer, so check each value instead
+            lower_metadata = self._lower_metadata
+            hit_ids.update(
+                id(doc) for doc, key in zip(documents, keys)
+                if any(needle in v for v in lower_metadata[key])
+            )
+        else:
+            # Values are joined by NUL, so a match can't span two of them
+            buffer, starts = self._metadata_segments(keys)
+            hit_ids.update(
+                id(documents[i])
+                for i in find_in_segments(buffer, starts, needle.encode("utf-8"))
+            )
+        
+        return [doc for doc in documents if id(doc) in hit_ids][:max_results]
+    
+    def metadata_json(self) -> str:
+        """
+        Serialize the metadata of every document as a JSON list.
+        
+        Returns:
+            The same text as json.dumps of the list of metadata dictionaries
+        """
+        keys = self._refresh()
+        parts = []
+        for doc, key in zip(self.collection.documents, keys):
+            cached = self._metadata_json.get(key)
+            if cached is None:
+                cached = self._metadata_json[key] = json.dumps(doc.metadata)
+            parts.append(cached)
+        return "[" + ", ".join(parts) + "]"
 
 
 @asynccontextmanager
@@ -91,8 +232,19 @@ async def mdp_lifespan(server: FastMCP) -> AsyncIterator[MDPContext]:
     Yields:
         The MDPContext instance with the initialized collection
     """
-    # Initialize document collection
-    collection = Collection()
+    # Load documents from MDP_COLLECTIONS_PATH if it is set, reading the files
+    # on worker threads so startup doesn't block the event loop. Version
+    # snapshots are history, not live documents, so they are left out.
+    directory = os.environ.get("MDP_COLLECTIONS_PATH")
+    if directory and os.path.isdir(directory):
+        collection = await asyncio.to_thread(
+            Collection.from_directory,
+            directory,
+            max_workers=os.cpu_count(),
+            skip_versions=True
+        )
+    else:
+        collection = Collection(name="MDP Documents")
     
     # Yield the context to the server
     yield MDPContext(collection=collection)
@@ -299,7 +451,7 @@ def create_mcp_server(name: str = "MDP Document Server") -> FastMCP:
         mdp_ctx: MDPContext = ctx.request_context.lifespan_context
         
         # Parse MDP content
-        doc = Document.from_text(content)
+        doc = Document.from_string(content)
         
         # Generate UUID if not present
         if "uuid" not in doc.metadata:
@@ -309,6 +461,7 @@ def create_mcp_server(name: str = "MDP Document Server") -> FastMCP:
         mdp_ctx.collection.add_document(doc)
         
         doc_id = doc.metadata['uuid']
+        mdp_ctx.invalidate(doc_id)
         return {"doc_id": doc_id, "message": f"Document created: {doc_id}"}
     
     @server.resource(
@@ -367,17 +520,17 @@ def create_mcp_server(name: str = "MDP Document Server") -> FastMCP:
         """
         mdp_ctx: MDPContext = ctx.request_context.lifespan_context
         
-        # Parse MDP content
-        updated_doc = Document.from_text(content)
+        # Parse MDP content once; the UUID check below reuses the parsed metadata
+        updated_doc = Document.from_string(content)
+        metadata = updated_doc.metadata
         
         # Ensure the UUID matches
-        if "uuid" in updated_doc.metadata and updated_doc.metadata["uuid"] != doc_id:
+        if metadata.setdefault("uuid", doc_id) != doc_id:
             raise ValueError("Document UUID cannot be changed")
-            
-        updated_doc.metadata["uuid"] = doc_id
         
         # Update in collection
         mdp_ctx.collection.update_document(updated_doc)
+        mdp_ctx.invalidate(doc_id)
         
         return {"message": f"Document updated: {doc_id}"}
     
@@ -406,6 +559,7 @@ def create_mcp_server(name: str = "MDP Document Server") -> FastMCP:
         
         # Remove from collection
         mdp_ctx.collection.remove_document(doc_id)
+        mdp_ctx.invalidate(doc_id)
         
         return {"message": f"Document deleted: {doc_id}"}
     
@@ -429,11 +583,8 @@ def create_mcp_server(name: str = "MDP Document Server") -> FastMCP:
         """
         mdp_ctx: MDPContext = ctx.request_context.lifespan_context
         
-        # Get all documents in the collection
-        docs = mdp_ctx.collection.documents
-        
-        # Return metadata for each document
-        return json.dumps([doc.metadata for doc in docs])
+        # Return metadata for each document, reusing cached serializations
+        return mdp_ctx.metadata_json()
     
     @server.tool(
         name="search_documents",
@@ -458,14 +609,10 @@ def create_mcp_server(name: str = "MDP Document Server") -> FastMCP:
         """
         mdp_ctx: MDPContext = ctx.request_context.lifespan_context
         
-        # Simple search implementation
-        results = []
-        for doc in mdp_ctx.collection.documents:
-            if query.lower() in doc.content.lower() or \
-               any(query.lower() in str(v).lower() for v in doc.metadata.values()):
-                results.append(doc.metadata)
+        # Search the cached lowercased content and metadata
+        results = mdp_ctx.search(query, max_results=max_results)
                 
-        return results[:max_results]
+        return [doc.metadata for doc in results]
     
     @server.tool(
         name="fetch_context",
@@ -490,18 +637,22 @@ def create_mcp_server(name: str = "MDP Document Server") -> FastMCP:
         """
         mdp_ctx: MDPContext = ctx.request_context.lifespan_context
         
-        # Find relevant documents (simple implementation)
-        relevant_docs = []
-        for doc in mdp_ctx.collection.documents:
-            if query.lower() in doc.content.lower():
-                relevant_docs.append(doc)
+        # Find relevant documents by content, stopping at max_results hits
+        relevant_docs = mdp_ctx.collection.search_content(query, max_results)
                 
-        # Construct context from relevant documents
+        # Construct context from relevant documents as one flat join, without
+        # building an intermediate string per document
         if relevant_docs:
-            context = "\n\n".join([
-                f"# {doc.metadata.get('title', 'Untitled')}\n\n{doc.content}"
-                for doc in relevant_docs[:max_results]  # Limit to top max_results matches
-            ])
+            parts = []
+            append = parts.append
+            for doc in relevant_docs:
+                append("# ")
+                append(str(doc.metadata.get('title', 'Untitled')))
+                append("\n\n")
+                append(doc.content)
+                append("\n\n")
+            parts.pop()  # Drop the trailing separator
+            context = "".join(parts)
         else:
             context = "No relevant documents found."
             
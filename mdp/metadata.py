@@ -6,6 +6,7 @@ This module provides functions for extracting and validating metadata from MDP f
 
 import re
 import datetime
+import functools
 import uuid
 from typing import Any, Dict, List, Tuple, Union, Optional
 
@@ -22,6 +23,19 @@ DATE_FORMAT = "%Y-%m-%d"
 IPFS_CID_V0_PATTERN = re.compile(r"^Qm[1-9A-HJ-NP-Za-km-z]{44}$")
 IPFS_CID_V1_PATTERN = re.compile(r"^b[a-zA-Z0-9]{58,}$")
 
+# Alphabets the CID patterns above allow after their prefix, built once so
+# validation can strip them with a single bytes.translate
+_CID_V0_ALPHABET = b"123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_CID_V1_ALPHABET = b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+
+# Byte table and mask for the canonical 8-4-4-4-12 hexadecimal UUID form:
+# translating a UUID maps every hex digit to "x" and keeps the dashes
+_UUID_TRANSLATION = bytes(
+    ord("x") if chr(i) in "0123456789abcdefABCDEF" else i if i == ord("-") else 0
+    for i in range(256)
+)
+_UUID_MASK = b"xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx"
+
 # Regular expression for validating semantic versioning (MAJOR.MINOR.PATCH)
 SEMVER_PATTERN = re.compile(r'^(\d+)\.(\d+)\.(\d+)$')
 
@@ -102,8 +116,9 @@ VALID_RELATIONSHIP_TYPES = [
 # Define IPFS URI prefix
 IPFS_URI_PREFIX = "ipfs://"
 
-# Valid collection ID types
-VALID_COLLECTION_ID_TYPES = ["uuid", "uri", "cid", "string"]
+# Valid collection ID types, in the order they are listed in error messages
+VALID_COLLECTION_ID_TYPES_ORDERED = ("uuid", "uri", "cid", "string")
+VALID_COLLECTION_ID_TYPES = frozenset(VALID_COLLECTION_ID_TYPES_ORDERED)
 
 def is_custom_field(field_name: str) -> bool:
     """
@@ -135,6 +150,7 @@ def validate_date_format(date_str: str) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=4096)
 def is_valid_ipfs_cid(cid: str) -> bool:
     """
     Check if a string is a valid IPFS Content Identifier (CID).
@@ -145,8 +161,24 @@ def is_valid_ipfs_cid(cid: str) -> bool:
     Returns:
         True if the string is a valid IPFS CID, False otherwise.
     """
-    # Check for CIDv0 (Qm...) or CIDv1 (b...)
-    return bool(IPFS_CID_V0_PATTERN.match(cid) or IPFS_CID_V1_PATTERN.match(cid))
+    # The prefix and length rule out most strings before any scanning
+    if cid.startswith("Qm"):
+        # CIDv0 is "Qm" plus 44 base58 characters
+        return (
+            len(cid) == 46
+            and cid.isascii()
+            and not cid[2:].encode("ascii").translate(None, _CID_V0_ALPHABET)
+        )
+    
+    if cid.startswith("b"):
+        # CIDv1 is "b" plus at least 58 alphanumeric characters
+        return (
+            len(cid) >= 59
+            and cid.isascii()
+            and not cid[1:].encode("ascii").translate(None, _CID_V1_ALPHABET)
+        )
+    
+    return False
 
 
 def create_ipfs_uri(cid: str) -> str:
@@ -386,23 +418,18 @@ def validate_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
         collection_id = metadata["collection_id"]
         collection_id_type = metadata.get("collection_id_type", "string")
         
-        if collection_id_type not in VALID_COLLECTION_ID_TYPES:
-            valid = False
-            errors["collection_id_type"] = f"Invalid collection ID type: {collection_id_type}. Must be one of: {', '.join(VALID_COLLECTION_ID_TYPES)}"
-        
-        # Validate based on collection_id_type
-        if collection_id_type == "uuid" and not is_valid_uuid(collection_id):
-            valid = False
-            errors["collection_id"] = f"Invalid UUID format for collection_id: {collection_id}"
-        elif collection_id_type == "uri":
-            try:
-                parse_uri(collection_id)
-            except ValueError as e:
-                valid = False
-                errors["collection_id"] = f"Invalid URI format for collection_id: {str(e)}"
-        elif collection_id_type == "cid" and not is_valid_ipfs_cid(collection_id):
+        if not isinstance(collection_id_type, str) or collection_id_type not in VALID_COLLECTION_ID_TYPES:
             valid = False
-            errors["collection_id"] = f"Invalid IPFS CID format for collection_id: {collection_id}"
+            errors["collection_id_type"] = f"Invalid collection ID type: {collection_id_type}. Must be one of: {', '.join(VALID_COLLECTION_ID_TYPES_ORDERED)}"
+        else:
+            # Validate based on collection_id_type
+            validator = _COLLECTION_ID_VALIDATORS.get(collection_id_type)
+            if validator is not None:
+                try:
+                    validator(collection_id)
+                except ValueError as e:
+                    valid = False
+                    errors["collection_id"] = str(e)
     
     # Validate relationships if present
     if "relationships" in metadata and metadata["relationships"]:
@@ -488,6 +515,25 @@ def create_metadata(
     return result
 
 
+def create_metadata_fast(title: str) -> Dict[str, Any]:
+    """
+    Create a metadata dictionary with default values and only a title.
+    
+    Equivalent to create_metadata(title=title), without the merge and UUID
+    validation passes that only matter when arbitrary fields are supplied.
+    
+    Args:
+        title: The document title.
+    
+    Returns:
+        A metadata dictionary with default values, a new UUID and the title.
+    """
+    result = DEFAULT_METADATA.copy()
+    result["uuid"] = generate_uuid()
+    result["title"] = title
+    return result
+
+
 def get_standard_fields() -> Dict[str, Dict[str, Any]]:
     """
     Get the dictionary of standard metadata fields with their descriptions and types.
@@ -547,25 +593,41 @@ def format_date(date_obj: Union[datetime.date, datetime.datetime, str]) -> str:
         ValueError: If the date_obj is not a valid date or cannot be parsed.
     """
     if isinstance(date_obj, (datetime.date, datetime.datetime)):
-        return date_obj.strftime(DATE_FORMAT)
+        # DATE_FORMAT has day resolution, so the ordinal fully determines the result
+        return _format_ordinal(date_obj.toordinal())
     elif isinstance(date_obj, str):
-        try:
-            # Try to parse the date string
-            parsed_date = datetime.datetime.strptime(date_obj, DATE_FORMAT)
-            return parsed_date.strftime(DATE_FORMAT)
-        except ValueError:
-            # Try a few common formats
-            for fmt in ["%Y/%m/%d", "%d-%m-%Y", "%m/%d/%Y", "%B %d, %Y"]:
-                try:
-                    parsed_date = datetime.datetime.strptime(date_obj, fmt)
-                    return parsed_date.strftime(DATE_FORMAT)
-                except ValueError:
-                    continue
-            raise ValueError(f"Could not parse date string: {date_obj}. Expected format: {DATE_FORMAT}")
+        return _format_date_string(date_obj)
     else:
         raise ValueError(f"Invalid date type: {type(date_obj)}. Expected datetime.date, datetime.datetime, or string.")
 
 
+# Dates are formatted over and over with the same few values (usually today),
+# so both conversions are memoized
+
+@functools.lru_cache(maxsize=128)
+def _format_ordinal(ordinal: int) -> str:
+    """Format a proleptic Gregorian ordinal in the standard date format."""
+    return datetime.date.fromordinal(ordinal).strftime(DATE_FORMAT)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_date_string(date_str: str) -> str:
+    """Normalize a date string to the standard date format."""
+    try:
+        # Try to parse the date string
+        parsed_date = datetime.datetime.strptime(date_str, DATE_FORMAT)
+        return parsed_date.strftime(DATE_FORMAT)
+    except ValueError:
+        # Try a few common formats
+        for fmt in ["%Y/%m/%d", "%d-%m-%Y", "%m/%d/%Y", "%B %d, %Y"]:
+            try:
+                parsed_date = datetime.datetime.strptime(date_str, fmt)
+                return parsed_date.strftime(DATE_FORMAT)
+            except ValueError:
+                continue
+        raise ValueError(f"Could not parse date string: {date_str}. Expected format: {DATE_FORMAT}")
+
+
 def generate_uuid() -> str:
     """
     Generate a new UUID (v4) for document identification.
@@ -576,6 +638,7 @@ def generate_uuid() -> str:
     return str(uuid.uuid4())
 
 
+@functools.lru_cache(maxsize=4096)
 def is_valid_uuid(uuid_str: str) -> bool:
     """
     Check if a string is a valid UUID.
@@ -586,6 +649,15 @@ def is_valid_uuid(uuid_str: str) -> bool:
     Returns:
         True if the string is a valid UUID, False otherwise.
     """
+    # Most UUIDs are in canonical form, which one translate checks without
+    # building a UUID object; other spellings fall through to uuid.UUID
+    if (
+        isinstance(uuid_str, str)
+        and uuid_str.isascii()
+        and uuid_str.encode("ascii").translate(_UUID_TRANSLATION) == _UUID_MASK
+    ):
+        return True
+    
     try:
         uuid_obj = uuid.UUID(uuid_str)
         return True
@@ -793,11 +865,39 @@ def add_uuid_to_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
     return metadata 
 
 
+def _validate_uuid_collection_id(collection_id: str) -> None:
+    """Raise ValueError if a collection_id of type "uuid" is not a valid UUID."""
+    if not is_valid_uuid(collection_id):
+        raise ValueError(f"Invalid UUID format for collection_id: {collection_id}")
+
+
+def _validate_uri_collection_id(collection_id: str) -> None:
+    """Raise ValueError if a collection_id of type "uri" is not a valid URI."""
+    try:
+        parse_uri(collection_id)
+    except ValueError as e:
+        raise ValueError(f"Invalid URI format for collection_id: {str(e)}")
+
+
+def _validate_cid_collection_id(collection_id: str) -> None:
+    """Raise ValueError if a collection_id of type "cid" is not a valid IPFS CID."""
+    if not is_valid_ipfs_cid(collection_id):
+        raise ValueError(f"Invalid IPFS CID format for collection_id: {collection_id}")
+
+
+# Validators for each collection_id_type; "string" accepts any value
+_COLLECTION_ID_VALIDATORS = {
+    "uuid": _validate_uuid_collection_id,
+    "uri": _validate_uri_collection_id,
+    "cid": _validate_cid_collection_id,
+}
+
+
 def create_collection_metadata(
     collection_name: str,
     position: Optional[int] = None,
     collection_id: Optional[str] = None,
-    collection_id_type: Optional[str] = "string",
+    collection_id_type: str = "string",
     **kwargs: Any
 ) -> Dict[str, Any]:
     """
@@ -817,20 +917,13 @@ def create_collection_metadata(
         ValueError: If the collection_id_type is invalid or the collection_id doesn't match the specified type
     """
     # Validate collection_id_type
-    if collection_id_type not in VALID_COLLECTION_ID_TYPES:
-        raise ValueError(f"Invalid collection_id_type: {collection_id_type}. Must be one of: {', '.join(VALID_COLLECTION_ID_TYPES)}")
+    if not isinstance(collection_id_type, str) or collection_id_type not in VALID_COLLECTION_ID_TYPES:
+        raise ValueError(f"Invalid collection_id_type: {collection_id_type}. Must be one of: {', '.join(VALID_COLLECTION_ID_TYPES_ORDERED)}")
     
     # Validate collection_id if provided
-    if collection_id:
-        if collection_id_type == "uuid" and not is_valid_uuid(collection_id):
-            raise ValueError(f"Invalid UUID format for collection_id: {collection_id}")
-        elif collection_id_type == "uri":
-            try:
-                parse_uri(collection_id)
-            except ValueError as e:
-                raise ValueError(f"Invalid URI format for collection_id: {str(e)}")
-        elif collection_id_type == "cid" and not is_valid_ipfs_cid(collection_id):
-            raise ValueError(f"Invalid IPFS CID format for collection_id: {collection_id}")
+    validator = _COLLECTION_ID_VALIDATORS.get(collection_id_type)
+    if collection_id and validator is not None:
+        validator(collection_id)
     
     # Create base metadata with other provided fields
     metadata = create_metadata(**kwargs)
@@ -12,7 +12,7 @@ from pathlib import Path
 import unittest
 
 from mdp.document import Document
-from mdp.conflict import ConflictManager, ConflictError, detect_concurrent_modification
+from mdp.conflict import Conflict, ConflictManager, ConflictError, detect_concurrent_modification
 from mdp.core import MDPFile
 
 
@@ -280,6 +280,22 @@ class TestConflictResolution(unittest.TestCase):
         # Should fail because conflicts are still present
         with self.assertRaises(ConflictError):
             Document.resolve_from_conflict_file(resolution_path, output_path)
+    
+    def test_resolve_from_conflict_file_with_horizontal_rule(self):
+        """Test that a body horizontal rule is not taken as the front matter end."""
+        resolution_path = os.path.join(self.test_dir, "resolution.mdp")
+        with open(resolution_path, 'w') as f:
+            f.write(
+                "---\ntitle: T\nversion: 1.0.0\n--- \n"
+                "Intro\n\n---\n\nAfter rule\n"
+            )
+        
+        output_path = os.path.join(self.test_dir, "resolved.mdp")
+        ConflictManager().resolve_from_conflict_file(resolution_path, output_path)
+        
+        resolved_doc = Document.from_file(output_path)
+        self.assertEqual(resolved_doc.title, "T")
+        self.assertIn("---\n\nAfter rule", resolved_doc.content)
 
 
 class TestConflictResolutionProgrammatically(unittest.TestCase):
@@ -392,5 +408,86 @@ class TestConflictResolutionProgrammatically(unittest.TestCase):
         self.assertTrue(summary["has_conflicts"])
 
 
+class TestConflictMergeEdgeCases(unittest.TestCase):
+    """Test merge results for edge cases in the Conflict class."""
+    
+    def _conflict(self, base, local, remote):
+        """Build a Conflict from (metadata, content) pairs."""
+        return Conflict(
+            MDPFile(metadata=base[0], content=base[1]),
+            MDPFile(metadata=local[0], content=local[1]),
+            MDPFile(metadata=remote[0], content=remote[1]),
+            "1.0.0", "1.1.0", "1.1.0"
+        )
+    
+    def test_resolve_content_conflict_updates_merged_doc(self):
+        """Test that resolving a content conflict updates the merged document."""
+        conflict = self._conflict(
+            ({"title": "Doc"}, "a\nb\nc"),
+            ({"title": "Doc"}, "a\nX\nc"),
+            ({"title": "Doc"}, "a\nY\nc")
+        )
+        
+        # The first conflict spans the whole document
+        conflict.resolve_content_conflict(0, "resolved")
+        self.assertEqual(conflict.merged_doc.content, "resolved")
+        
+        # Content replaced directly on the merged document is not overwritten
+        conflict.merged_doc.content = "replaced"
+        conflict.resolve_content_conflict(0, "again")
+        self.assertEqual(conflict.merged_doc.content, "again")
+    
+    def test_auto_merge_keeps_remote_edit_of_locally_deleted_field(self):
+        """Test that a local deletion does not discard a remote edit."""
+        conflict = self._conflict(
+            ({"a": 2, "b": 2, "c": 1}, "text"),
+            ({"c": 2}, "text"),
+            ({"a": 1, "b": 1}, "text")
+        )
+        
+        success, merged = conflict.auto_merge()
+        self.assertTrue(success)
+        self.assertEqual(merged.metadata, {"c": 2, "a": 1, "b": 1})
+    
+    def test_auto_merge_keeps_local_deletion_of_unchanged_field(self):
+        """Test that a field deleted locally and unchanged remotely stays deleted."""
+        conflict = self._conflict(
+            ({"a": 1, "b": 1}, "text"),
+            ({"b": 1}, "text"),
+            ({"a": 1, "b": 2}, "text")
+        )
+        
+        success, merged = conflict.auto_merge()
+        self.assertTrue(success)
+        self.assertEqual(merged.metadata, {"b": 2})
+    
+    def test_conflict_file_with_region_past_end(self):
+        """Test conflict markers for a region beyond the end of the local content."""
+        conflict = self._conflict(
+            ({"title": "Doc"}, "a\nb\n"),
+            ({"title": "Doc"}, "a\nb\n"),
+            ({"title": "Doc"}, "a\nb\n")
+        )
+        conflict.content_conflicts = [
+            {"region": (5, 6), "local": "L", "remote": "R"},
+            {"region": (3, 4), "local": "X", "remote": "Y"},
+        ]
+        
+        # The region past the end is appended to the text as it stands, and
+        # the next conflict is placed against the text including that block
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = ConflictManager().create_conflict_file(
+                conflict, os.path.join(temp_dir, "conflict.mdp")
+            )
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+        
+        self.assertTrue(text.endswith(
+            "a\nb\n\n"
+            "<<<<<<< LOCAL (Conflict 1)\nX\n=======\nY\n>>>>>>> REMOTE\n"
+            "<<<<<<< LOCAL (Conflict 0)\nL\n=======\nR\n>>>>>>> REMOTE"
+        ))
+
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
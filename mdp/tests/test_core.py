@@ -11,11 +11,12 @@ import unittest
 from datetime import date, datetime
 from pathlib import Path
 
-from mdp.core import MDPFile, read_mdp, write_mdp
+from mdp.core import MDPFile, read_mdp, read_mdp_cached, write_mdp
 from mdp.metadata import (
     extract_metadata, 
     validate_metadata, 
     create_metadata,
+    create_metadata_fast,
     get_standard_fields,
     create_custom_field,
     format_date,
@@ -88,6 +89,51 @@ This is a test MDP file."""
             # Clean up the temporary file
             os.unlink(temp_path)
 
+    def test_read_mdp_lazy(self):
+        """Test reading an MDP file with deferred metadata parsing."""
+        with tempfile.NamedTemporaryFile(suffix=".mdp", delete=False) as temp_file:
+            temp_path = temp_file.name
+        
+        try:
+            with open(temp_path, "w") as f:
+                f.write("---\ntitle: [unclosed\n---\n\n# Content")
+            
+            # Content is available without parsing the malformed metadata
+            read_file = read_mdp(temp_path, lazy=True)
+            self.assertEqual(read_file.content, "# Content")
+            
+            # The YAML error surfaces on first metadata access
+            with self.assertRaises(ValueError):
+                read_file.metadata
+            
+            write_mdp(temp_path, {"title": "Lazy"}, "# Content")
+            read_file = read_mdp(temp_path, lazy=True)
+            self.assertEqual(read_file.metadata, {"title": "Lazy"})
+        finally:
+            os.unlink(temp_path)
+
+    def test_read_mdp_cached(self):
+        """Test reading MDP files through the parse cache."""
+        with tempfile.NamedTemporaryFile(suffix=".mdp", delete=False) as temp_file:
+            temp_path = temp_file.name
+        
+        try:
+            write_mdp(temp_path, {"title": "Cached", "tags": ["a"]}, "# Content")
+            
+            first = read_mdp_cached(temp_path)
+            first.metadata["tags"].append("b")
+            
+            # Later reads don't see changes made to earlier results
+            second = read_mdp_cached(temp_path)
+            self.assertEqual(second.metadata, {"title": "Cached", "tags": ["a"]})
+            self.assertEqual(second.content, "# Content")
+            
+            # Saving the file replaces the cached parse, even with the same size
+            write_mdp(temp_path, {"title": "Cachex", "tags": ["a"]}, "# Content")
+            self.assertEqual(read_mdp_cached(temp_path).metadata["title"], "Cachex")
+        finally:
+            os.unlink(temp_path)
+
     def test_write_mdp(self):
         """Test the write_mdp function."""
         metadata = {"title": "Test MDP File", "context": "This is a test MDP file"}
@@ -256,6 +302,17 @@ This is a test MDP file."""
             self.assertEqual(title_field["type"], "string")
         else:
             self.assertEqual(title_field["type"], str)
+    
+    def test_create_metadata_fast(self):
+        """Test creating title-only metadata without the general merge path."""
+        fast = create_metadata_fast("Fast")
+        full = create_metadata(title="Fast")
+        
+        self.assertEqual(list(fast), list(full))
+        self.assertEqual(fast["title"], "Fast")
+        self.assertEqual(fast["created_at"], full["created_at"])
+        self.assertTrue(validate_metadata(fast))
+        self.assertNotEqual(fast["uuid"], create_metadata_fast("Fast")["uuid"])
 
 
 class TestMDPUtils(unittest.TestCase):
@@ -0,0 +1,85 @@
+"""
+Unit tests for the MCP server's document context.
+
+This module tests the per-document caches MDPContext keeps for searching
+and listing documents.
+"""
+
+import json
+import unittest
+
+from mdp import Document, Collection
+from mdp.metadata import generate_uuid
+
+try:
+    from mdp.mcp.server import MDPContext
+except ImportError:
+    MDPContext = None
+
+
+@unittest.skipIf(MDPContext is None, "fastmcp is not installed")
+class TestMDPContext(unittest.TestCase):
+    """Tests for the MDPContext caches."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.collection = Collection("Test Collection")
+        
+        # Both documents share a UUID, like a document and its version snapshot
+        self.uuid = generate_uuid()
+        self.first = Document.create(title="First", content="alpha content", uuid=self.uuid)
+        self.second = Document.create(title="Second", content="beta content", uuid=self.uuid)
+        self.collection.add_document(self.first)
+        self.collection.add_document(self.second)
+        self.ctx = MDPContext(self.collection)
+
+    def test_metadata_json(self):
+        """Test that listing serializes every document's own metadata."""
+        expected = json.dumps([doc.metadata for doc in self.collection.documents])
+        self.assertEqual(self.ctx.metadata_json(), expected)
+
+        # Cached serializations are reused on the next call
+        self.assertEqual(self.ctx.metadata_json(), expected)
+
+    def test_search_with_shared_uuid(self):
+        """Test that documents sharing a UUID are searched separately."""
+        self.assertEqual(self.ctx.search("beta"), [self.second])
+        self.assertEqual(self.ctx.search("second"), [self.second])
+        self.assertEqual(self.ctx.search("first"), [self.first])
+        self.assertEqual(self.ctx.search("content"), [self.first, self.second])
+        self.assertEqual(self.ctx.search("second", include_metadata=False), [])
+    
+    def test_search_max_results(self):
+        """Test that search results are limited to max_results."""
+        self.assertEqual(self.ctx.search("content", max_results=1), [self.first])
+        self.assertEqual(self.ctx.search("content", max_results=5), [self.first, self.second])
+        self.assertEqual(self.ctx.search("content", max_results=0), [])
+        self.assertEqual(self.ctx.search("content", max_results=-1), [])
+        self.assertEqual(
+            self.ctx.search("content", include_metadata=False, max_results=-1),
+            []
+        )
+
+    def test_invalidate(self):
+        """Test that invalidated documents are reindexed."""
+        self.assertEqual(self.ctx.search("renamed"), [])
+
+        self.second.title = "Renamed"
+        self.ctx.invalidate(self.uuid)
+        self.assertEqual(self.ctx.search("renamed"), [self.second])
+        self.assertIn('"Renamed"', self.ctx.metadata_json())
+
+    def test_removed_document(self):
+        """Test that removed documents drop out of the caches."""
+        self.assertEqual(len(self.ctx.search("content")), 2)
+
+        self.collection.documents.remove(self.first)
+        self.assertEqual(self.ctx.search("content"), [self.second])
+        self.assertEqual(
+            self.ctx.metadata_json(),
+            json.dumps([self.second.metadata])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -119,6 +119,27 @@ class TestDocument(unittest.TestCase):
         if hasattr(loaded_doc, 'tags') and isinstance(loaded_doc.tags, list):
             self.assertIn("test-tag", loaded_doc.tags)
 
+    def test_document_from_string(self):
+        """Test creating a document from MDP text."""
+        doc = Document.from_string("---\ntitle: From Text\n---\n\n# Body")
+        
+        self.assertEqual(doc.title, "From Text")
+        self.assertEqual(doc.content, "# Body")
+        self.assertIsNone(doc.path)
+
+    def test_add_tags(self):
+        """Test adding several tags at once."""
+        doc = Document.create(title="Tagged", tags=["a"])
+        
+        # Existing and repeated tags are only added once, in order
+        doc.add_tags(["b", "a", "c", "b"])
+        self.assertEqual(doc.tags, ["a", "b", "c"])
+        
+        # Documents without tags get a new list
+        doc = Document.create(title="Untagged")
+        doc.add_tags(["x"])
+        self.assertEqual(doc.tags, ["x"])
+
     def test_custom_metadata(self):
         """Test adding and retrieving custom metadata."""
         doc = Document.create(title="Custom Metadata Test")
@@ -234,6 +255,64 @@ class TestCollection(unittest.TestCase):
         self.assertIn("Document 1", doc_titles)
         self.assertIn("Document 2", doc_titles)
 
+    def test_search_content_many(self):
+        """Test searching for several queries at once."""
+        collection = Collection(name="Test Collection")
+        doc1 = Document.create(title="Document 1", content="Alpha and beta")
+        doc2 = Document.create(title="Document 2", content="gamma (draft)")
+        collection.add_documents([doc1, doc2])
+        
+        results = collection.search_content_many(["BETA", "(draft)", "delta", ""])
+        
+        # Each query gets the same documents search_content would return
+        self.assertEqual(results["BETA"], [doc1])
+        self.assertEqual(results["(draft)"], [doc2])
+        self.assertEqual(results["delta"], [])
+        self.assertEqual(results[""], [doc1, doc2])
+        
+        # Queries containing NUL bytes are matched literally
+        doc3 = Document.create(title="Document 3", content="null\0byte")
+        collection.add_document(doc3)
+        results = collection.search_content_many(["null\0byte", "l\0zzz", "beta\0gamma"])
+        self.assertEqual(results["null\0byte"], [doc3])
+        self.assertEqual(results["l\0zzz"], [])
+        self.assertEqual(results["beta\0gamma"], [])
+
+    def test_load_collection_with_workers(self):
+        """Test loading a collection on a thread pool."""
+        collection_dir = Path(self.temp_dir) / "collection"
+        collection_dir.mkdir()
+        for i in range(5):
+            Document.create(title=f"Document {i}").save(collection_dir / f"doc{i}.mdp")
+        
+        sequential = Collection.from_directory(collection_dir)
+        threaded = Collection.from_directory(collection_dir, max_workers=4)
+        
+        # Both loads find the same documents in the same order
+        self.assertEqual(
+            [doc.title for doc in threaded.documents],
+            [doc.title for doc in sequential.documents]
+        )
+        self.assertEqual(len(threaded.documents), 5)
+
+    def test_load_collection_skip_versions(self):
+        """Test loading a collection without version snapshots or invalid files."""
+        collection_dir = Path(self.temp_dir) / "collection"
+        versions_dir = collection_dir / ".versions"
+        versions_dir.mkdir(parents=True)
+        doc = Document.create(title="Live")
+        doc.save(collection_dir / "doc.mdp")
+        doc.save(versions_dir / "doc.1.0.0.mdp")
+        (collection_dir / "broken.mdp").write_text("---\ntitle: [broken\n---\n")
+        
+        with self.assertWarns(UserWarning):
+            everything = Collection.from_directory(collection_dir)
+        self.assertEqual(len(everything.documents), 2)
+        
+        with self.assertWarns(UserWarning):
+            live = Collection.from_directory(collection_dir, skip_versions=True)
+        self.assertEqual([d.path for d in live.documents], [collection_dir / "doc.mdp"])
+
     def test_filter_documents(self):
         """Test filtering documents in a collection."""
         # Create a collection with documents
@@ -251,6 +330,29 @@ class TestCollection(unittest.TestCase):
         self.assertIn(doc1, category_a)
         self.assertIn(doc3, category_a)
 
+    def test_search_content(self):
+        """Test searching document content in a collection."""
+        # Create a collection with documents
+        collection = Collection(name="Test Collection")
+        doc1 = Document.create(title="Document 1", content="Alpha and beta")
+        doc2 = Document.create(title="Document 2", content="gamma")
+        doc3 = Document.create(title="Document 3", content="BETA release")
+        collection.add_documents([doc1, doc2, doc3])
+        
+        # Search is case-insensitive and keeps collection order
+        self.assertEqual(collection.search_content("beta"), [doc1, doc3])
+        self.assertEqual(collection.search_content("beta", max_results=1), [doc1])
+        self.assertEqual(collection.search_content("beta", max_results=0), [])
+        self.assertEqual(collection.search_content("beta", max_results=-1), [])
+        
+        # Matches never span two documents
+        self.assertEqual(collection.search_content("beta\0gamma"), [])
+        self.assertEqual(collection.search_content("betagamma"), [])
+        
+        # Content changes are picked up on the next search
+        doc2.content = "Beta testing"
+        self.assertEqual(collection.search_content("beta"), [doc1, doc2, doc3])
+
 
 class TestBackwardCompatibility(unittest.TestCase):
     """Tests for backward compatibility with the original API."""
@@ -7,6 +7,7 @@ such as converting between different formats and finding MDP files.
 
 import os
 import re
+from bisect import bisect_right
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union, Callable
 
@@ -539,4 +540,49 @@ def get_collection_hierarchy(
         # Remove self from collection members
         result["siblings"] = [doc for doc in collection_members if doc.metadata.get("uuid") != mdp_file.metadata.get("uuid")]
     
-    return result 
\ No newline at end of file
+    return result 
+
+
+def find_in_segments(
+    buffer: bytes,
+    starts: List[int],
+    needle: bytes,
+    max_results: Optional[int] = None
+) -> List[int]:
+    """
+    Find which segments of a joined buffer contain a byte string.
+    
+    The buffer holds consecutive segments separated by a single byte, with
+    starts[i] the offset of segment i. Each segment is reported at most once
+    and a match is never allowed to straddle two segments.
+    
+    Args:
+        buffer: The joined segments
+        starts: The start offset of each segment, in increasing order
+        needle: The byte string to search for
+        max_results: Optional maximum number of segments to return
+        
+    Returns:
+        Indices of the matching segments, in order
+    """
+    if not starts or (max_results is not None and max_results <= 0):
+        return []
+    
+    hits = []
+    pos = buffer.find(needle)
+    while pos != -1:
+        # Map the hit back to the segment whose span contains it
+        index = bisect_right(starts, pos) - 1
+        end = starts[index + 1] - 1 if index + 1 < len(starts) else len(buffer)
+        
+        if pos + len(needle) <= end:
+            hits.append(index)
+            if max_results is not None and len(hits) >= max_results:
+                break
+            # Continue from the start of the next segment
+            pos = buffer.find(needle, end + 1)
+        else:
+            # The hit straddles a segment boundary
+            pos = buffer.find(needle, pos + 1)
+    
+    return hits